@@ -1,31 +1,108 @@
 """Application entry point."""
 
+import importlib
 import os
+import threading
+from typing import Any, Callable, Iterable
 
 from dotenv import load_dotenv
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 
+from assets import init_assets
+from commands import register_commands
+from compression import Compress
+from memprofile import MemoryProfiler
 from models import create_db
-from routes.home import home_bp
-from routes.players import players_bp
-from routes.campaigns import campaigns_bp
-from routes.characters import characters_bp
+from tenancy import init_tenancy
 
 load_dotenv('.env')
 
-def create_app() -> Flask:
-    """Create a Flask application."""
+# (module, attribute) pairs so the route modules and their form/service imports can be loaded on demand
+BLUEPRINTS: tuple[tuple[str, str], ...] = (
+    ('routes.home', 'home_bp'),
+    ('routes.players', 'players_bp'),
+    ('routes.campaigns', 'campaigns_bp'),
+    ('routes.characters', 'characters_bp'),
+    ('routes.sse', 'events_bp'),
+)
+
+
+def register_blueprints(app: Flask) -> None:
+    """Import the route modules and register their blueprints."""
+    for module_name, attribute in BLUEPRINTS:
+        module = importlib.import_module(module_name)
+        app.register_blueprint(getattr(module, attribute))
+
+
+def csrf_token() -> str:
+    """Template helper for the CSRF token; flask_wtf is only imported once a page renders it."""
+    from flask_wtf.csrf import generate_csrf
+
+    return generate_csrf()
+
+
+class LazyBlueprintMiddleware:
+    """WSGI middleware that registers the blueprints when the first request arrives."""
+
+    def __init__(self, app: Flask) -> None:
+        """Wrap the app's WSGI callable."""
+        self.app = app
+        self.wsgi_app = app.wsgi_app
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        """Load the blueprints once, then hand the request to Flask."""
+        if not self.loaded:
+            with self._lock:
+                if not self.loaded:
+                    register_blueprints(self.app)
+                    self.loaded = True
+        return self.wsgi_app(environ, start_response)
+
+
+def create_app(fast_startup: bool | None = None, memory_profile: bool | None = None) -> Flask:
+    """Create a Flask application.
+
+    Fast startup skips create_all when the schema version is current and defers the blueprints to the first request.
+    Memory profiling traces allocations per endpoint and serves the figures at /admin/memory.
+    """
+    if fast_startup is None:
+        fast_startup = os.getenv('FAST_STARTUP', '').lower() in ('1', 'true', 'yes')
+    if memory_profile is None:
+        memory_profile = os.getenv('MEMORY_PROFILE', '').lower() in ('1', 'true', 'yes')
+
     app = Flask(__name__)
     app.secret_key = os.getenv('SECRET_KEY', 'very_secret_key')
+    # /events only sees changes made in this process; serve.py turns it off for multi-worker setups
+    app.config['LIVE_UPDATES'] = os.getenv('LIVE_UPDATES', 'true').lower() in ('1', 'true', 'yes')
+
+    template_cache_dir = os.getenv('TEMPLATE_CACHE_DIR')
+    if template_cache_dir:
+        os.makedirs(template_cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(template_cache_dir)
 
     # Create the database
-    create_db()
+    create_db(skip_if_current=fast_startup)
+
+    # Tenant shards get their schema lazily on first use
+    if os.getenv('TENANT_DATABASE_URL'):
+        init_tenancy(app)
 
     # Register blueprints here
-    app.register_blueprint(home_bp)
-    app.register_blueprint(players_bp)
-    app.register_blueprint(campaigns_bp)
-    app.register_blueprint(characters_bp)
+    if fast_startup:
+        app.wsgi_app = LazyBlueprintMiddleware(app)
+    else:
+        register_blueprints(app)
+
+    # JSON/AJAX requests send this token in the X-CSRFToken header
+    app.jinja_env.globals['csrf_token'] = csrf_token
+    init_assets(app)
+    Compress(app)
+    if memory_profile:
+        MemoryProfiler(app)
+    register_commands(app)
 
     return app
 
@@ -0,0 +1,120 @@
+"""Static asset pipeline: bundles and fingerprints the vendor CSS/JS."""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import shutil
+import urllib.request
+from pathlib import Path
+
+from flask import Blueprint, Flask, Response, current_app, request, send_from_directory, url_for
+
+# Fingerprinted files never change, so clients may cache them for a year
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+FONTAWESOME = 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4'
+
+# Bundle name -> source URLs, concatenated in order
+BUNDLES: dict[str, list[str]] = {
+    'app.css': [
+        'https://stackpath.bootstrapcdn.com/bootstrap/4.5.2/css/bootstrap.min.css',
+        f'{FONTAWESOME}/css/all.min.css',
+    ],
+    'app.js': [
+        'https://code.jquery.com/jquery-3.5.1.slim.min.js',
+        'https://cdn.jsdelivr.net/npm/@popperjs/core@2.5.4/dist/umd/popper.min.js',
+        'https://stackpath.bootstrapcdn.com/bootstrap/4.5.2/js/bootstrap.min.js',
+    ],
+}
+
+# Font files referenced by the FontAwesome CSS as ../webfonts/<name>
+FONTS: list[str] = [
+    f'{FONTAWESOME}/webfonts/fa-solid-900.woff2',
+    f'{FONTAWESOME}/webfonts/fa-regular-400.woff2',
+    f'{FONTAWESOME}/webfonts/fa-brands-400.woff2',
+]
+
+assets_bp = Blueprint('assets', __name__)
+
+
+def _fetch(url: str, vendor_dir: Path) -> bytes:
+    """Return a vendor file, downloading it once into the vendor directory."""
+    path = vendor_dir / url.rsplit('/', 1)[-1]
+    if not path.exists():
+        with urllib.request.urlopen(url) as response:
+            path.write_bytes(response.read())
+    return path.read_bytes()
+
+
+def _write_fingerprinted(dist_dir: Path, name: str, content: bytes) -> str:
+    """Write content under a hashed filename, plus a gzip copy, and return the filename."""
+    stem, suffix = name.rsplit('.', 1)
+    filename = f'{stem}.{hashlib.sha256(content).hexdigest()[:12]}.{suffix}'
+    (dist_dir / filename).write_bytes(content)
+    if mimetypes.guess_type(filename)[0] in ('text/css', 'text/javascript', 'application/javascript'):
+        (dist_dir / f'{filename}.gz').write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+    return filename
+
+
+def build_assets(static_dir: Path) -> dict[str, str]:
+    """Bundle and fingerprint the vendor assets, returning the manifest."""
+    vendor_dir = static_dir / 'vendor'
+    dist_dir = static_dir / 'dist'
+    vendor_dir.mkdir(parents=True, exist_ok=True)
+    if dist_dir.exists():
+        shutil.rmtree(dist_dir)
+    dist_dir.mkdir(parents=True)
+
+    manifest: dict[str, str] = {}
+    for url in FONTS:
+        name = url.rsplit('/', 1)[-1]
+        manifest[name] = _write_fingerprinted(dist_dir, name, _fetch(url, vendor_dir))
+
+    for bundle, urls in BUNDLES.items():
+        content = b'\n'.join(_fetch(url, vendor_dir) for url in urls)
+        if bundle.endswith('.css'):
+            # Fonts sit next to the bundle under their fingerprinted names
+            for name, filename in manifest.items():
+                content = content.replace(f'../webfonts/{name}'.encode(), filename.encode())
+        manifest[bundle] = _write_fingerprinted(dist_dir, bundle, content)
+
+    (dist_dir / 'manifest.json').write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def load_manifest(static_dir: Path) -> dict[str, str]:
+    """Load the build manifest, or an empty one if the assets haven't been built."""
+    path = static_dir / 'dist' / 'manifest.json'
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+@assets_bp.get('/assets/<path:filename>')
+def static_asset(filename: str) -> Response:
+    """Serve a fingerprinted asset with far-future cache headers."""
+    dist_dir = Path(current_app.static_folder) / 'dist'
+    mimetype = mimetypes.guess_type(filename)[0]
+    if request.accept_encodings['gzip'] and (dist_dir / f'{filename}.gz').is_file():
+        response = send_from_directory(dist_dir, f'{filename}.gz', mimetype=mimetype, max_age=ASSET_MAX_AGE)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = send_from_directory(dist_dir, filename, max_age=ASSET_MAX_AGE)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+def init_assets(app: Flask) -> None:
+    """Register the asset route and the asset_url template helper."""
+    manifest = load_manifest(Path(app.static_folder))
+    app.register_blueprint(assets_bp)
+
+    def asset_url(name: str) -> str | None:
+        """URL of a built asset, or None when running without a build."""
+        filename = manifest.get(name)
+        return url_for('assets.static_asset', filename=filename) if filename else None
+
+    app.jinja_env.globals['asset_url'] = asset_url
@@ -0,0 +1,146 @@
+"""Flask CLI commands."""
+
+from pathlib import Path
+
+import click
+from flask import Flask, current_app
+from sqlalchemy import Engine, text
+
+from assets import build_assets
+from db import TenantError, get_engine
+from models import create_db
+from tenancy import create_tenant
+
+
+@click.command('precompile-templates')
+def precompile_templates_command() -> None:
+    """Compile every template into the Jinja bytecode cache."""
+    env = current_app.jinja_env
+    if env.bytecode_cache is None:
+        raise click.ClickException('Set TEMPLATE_CACHE_DIR to enable the template bytecode cache.')
+    names = env.list_templates(extensions=['html'])
+    for name in names:
+        env.get_template(name)
+    click.echo(f'Compiled {len(names)} templates.')
+
+
+@click.command('build-assets')
+def build_assets_command() -> None:
+    """Bundle and fingerprint the vendor CSS/JS into static/dist."""
+    try:
+        manifest = build_assets(Path(current_app.static_folder))
+    except OSError as e:
+        raise click.ClickException(f'Could not fetch a vendor file ({e}); copy it into static/vendor and retry.')
+    for name, filename in manifest.items():
+        click.echo(f'{name} -> {filename}')
+
+
+@click.command('seed')
+@click.option('--players', default=1_000, show_default=True, help='Players to create.')
+@click.option('--campaigns', default=100, show_default=True, help='Campaigns to create.')
+@click.option('--characters', default=10_000, show_default=True, help='Characters to create.')
+@click.option('--seed', default=0, show_default=True, help='Random seed; the same seed gives the same data.')
+@click.option('--batch-size', default=10_000, show_default=True, help='Rows per INSERT batch.')
+@click.option('--tenant', help="Create and seed this tenant's shard instead of DATABASE_URL.")
+def seed_command(players: int, campaigns: int, characters: int, seed: int, batch_size: int, tenant: str | None) -> None:
+    """Fill DATABASE_URL with generated players, campaigns and characters."""
+    from seeding import SeedResult, seed_database
+
+    if tenant:
+        try:
+            engine = create_tenant(tenant)
+        except TenantError as e:
+            raise click.ClickException(e.message)
+    else:
+        create_db()
+        engine = get_engine()
+
+    def report(result: SeedResult) -> None:
+        click.echo(f'{result.table:<10}{result.rows:>12,} rows {result.seconds:>8.2f}s {result.rows_per_second:>12,.0f} rows/s')
+
+    results = seed_database(engine, players, campaigns, characters, seed, batch_size, progress=report)
+    rows, seconds = sum(r.rows for r in results), sum(r.seconds for r in results)
+    click.echo(f'{"total":<10}{rows:>12,} rows {seconds:>8.2f}s {rows / seconds if seconds else 0:>12,.0f} rows/s')
+
+
+@click.command('explain')
+@click.option('--scans-only', is_flag=True, help='Only show statements with a full table scan.')
+def explain_command(scans_only: bool) -> None:
+    """EXPLAIN every service query against DATABASE_URL and flag full table scans."""
+    # queryplan imports every service module; keep that off the app import path
+    from queryplan import count_rows, explain_service_queries
+
+    engine = get_engine()
+    counts = ', '.join(f'{table}={rows:,}' for table, rows in count_rows(engine).items())
+    click.echo(f'{engine.url.render_as_string(hide_password=True)} ({counts})')
+    results = explain_service_queries(engine)
+    for result in results:
+        if scans_only and not result.full_scans:
+            continue
+        marker = click.style(' FULL SCAN', fg='red') if result.full_scans else ''
+        click.echo(f'\n{click.style(result.method, bold=True)}{marker}')
+        click.echo(f'  {" ".join(result.statement.split())}')
+        for line in result.plan:
+            click.echo(f'    {"!! " if line in result.full_scans else ""}{line}')
+    flagged = sorted({result.method for result in results if result.full_scans})
+    click.echo(f'\n{len(flagged)} methods with full table scans: {", ".join(flagged) or "none"}')
+
+
+@click.command('tenant-report')
+@click.option('--tenant', 'tenants', multiple=True, help='Tenant to include; defaults to every known tenant.')
+@click.option('--sql', help='Query to run on each shard instead of the row counts; shards are opened read-only.')
+@click.option('--workers', default=8, show_default=True, help='Shards queried in parallel.')
+def tenant_report_command(tenants: tuple[str, ...], sql: str | None, workers: int) -> None:
+    """Query every tenant's shard in parallel and print per-tenant and total results."""
+    from queryplan import count_rows
+    from tenancy import fan_out, list_tenants, read_only_connection
+
+    tenants = list(tenants) or list_tenants()
+    if not tenants:
+        raise click.ClickException('No tenants found; pass --tenant or set TENANTS.')
+
+    def query(engine: Engine) -> dict[str, int] | list[tuple]:
+        if sql is None:
+            return count_rows(engine)
+        with read_only_connection(engine) as connection:
+            return [tuple(row) for row in connection.execute(text(sql))]
+
+    totals: dict[str, int] = {}
+    failed = 0
+    for result in fan_out(query, tenants, max_workers=workers):
+        if result.error is not None:
+            failed += 1
+            click.echo(f'{result.tenant}: {click.style(f"{type(result.error).__name__}: {result.error}", fg="red")}')
+        elif sql is None:
+            for table, rows in result.value.items():
+                totals[table] = totals.get(table, 0) + rows
+            click.echo(f'{result.tenant}: ' + ', '.join(f'{table}={rows:,}' for table, rows in result.value.items()))
+        else:
+            for row in result.value:
+                click.echo(f'{result.tenant}\t' + '\t'.join(str(value) for value in row))
+    if totals:
+        click.echo('total: ' + ', '.join(f'{table}={rows:,}' for table, rows in totals.items()))
+    if failed:
+        raise click.ClickException(f'{failed} of {len(tenants)} shards failed.')
+
+
+@click.command('create-tenant')
+@click.argument('tenants', nargs=-1, required=True)
+def create_tenant_command(tenants: tuple[str, ...]) -> None:
+    """Create shards for new tenants; requests for tenants without a shard get a 404."""
+    for tenant in tenants:
+        try:
+            engine = create_tenant(tenant)
+        except TenantError as e:
+            raise click.ClickException(e.message)
+        click.echo(f'{tenant} -> {engine.url.render_as_string(hide_password=True)}')
+
+
+def register_commands(app: Flask) -> None:
+    """Register the CLI commands on the app."""
+    app.cli.add_command(precompile_templates_command)
+    app.cli.add_command(build_assets_command)
+    app.cli.add_command(seed_command)
+    app.cli.add_command(explain_command)
+    app.cli.add_command(tenant_report_command)
+    app.cli.add_command(create_tenant_command)
@@ -0,0 +1,127 @@
+"""Response compression middleware."""
+
+import os
+import zlib
+from typing import Iterable, Iterator
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+DEFAULT_MIMETYPES = frozenset({
+    'text/html',
+    'text/css',
+    'text/plain',
+    'text/xml',
+    'application/json',
+    'application/javascript',
+    'image/svg+xml',
+})
+
+
+class Compress:
+    """Compress responses with brotli or gzip when the client accepts it."""
+
+    def __init__(self, app: Flask | None = None) -> None:
+        """Initialize the extension."""
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """Read the compression settings and register the after_request hook."""
+        app.config.setdefault('COMPRESS_MIN_SIZE', int(os.getenv('COMPRESS_MIN_SIZE', '500')))
+        app.config.setdefault('COMPRESS_LEVEL', int(os.getenv('COMPRESS_LEVEL', '6')))
+        app.config.setdefault('COMPRESS_MIMETYPES', DEFAULT_MIMETYPES)
+        app.after_request(self.after_request)
+        self.app = app
+
+    def choose_encoding(self) -> str | None:
+        """Pick the best encoding the client accepts."""
+        accepted = request.accept_encodings
+        if brotli is not None and accepted['br']:
+            return 'br'
+        if accepted['gzip']:
+            return 'gzip'
+        return None
+
+    def after_request(self, response: Response) -> Response:
+        """Compress the response body if it qualifies."""
+        config = self.app.config
+        if (
+            response.status_code < 200
+            or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in config['COMPRESS_MIMETYPES']
+        ):
+            return response
+
+        encoding = self.choose_encoding()
+        if encoding is None:
+            return response
+
+        level = config['COMPRESS_LEVEL']
+        if response.is_streamed:
+            # Compress chunk by chunk so streamed bodies are never buffered in full
+            response.response = _compress_stream(response.response, encoding, level)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < config['COMPRESS_MIN_SIZE']:
+                return response
+            response.set_data(_compress(data, encoding, level))
+
+        response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        return response
+
+
+def _compressor(encoding: str, level: int):
+    """Create an incremental compressor exposing compress/flush."""
+    if encoding == 'br':
+        return _BrotliCompressor(level)
+    return zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 writes a gzip header
+
+
+def _compress(data: bytes, encoding: str, level: int) -> bytes:
+    """Compress a complete body."""
+    compressor = _compressor(encoding, level)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _compress_stream(chunks: Iterable[bytes | str], encoding: str, level: int) -> Iterator[bytes]:
+    """Compress a streamed body, yielding output as the compressor produces it."""
+    compressor = _compressor(encoding, level)
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            # A sync flush after each chunk stops slow streams sitting in the compressor's buffer
+            output = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if output:
+                yield output
+        yield compressor.flush()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+class _BrotliCompressor:
+    """Adapt brotli.Compressor to the zlib compress/flush interface."""
+
+    def __init__(self, level: int) -> None:
+        """Create the underlying compressor."""
+        self.compressor = brotli.Compressor(quality=min(level, 11))
+
+    def compress(self, data: bytes) -> bytes:
+        """Feed data to the compressor."""
+        return self.compressor.process(data)
+
+    def flush(self, mode: int = zlib.Z_FINISH) -> bytes:
+        """Emit buffered output, finishing the stream unless a sync flush is requested."""
+        if mode == zlib.Z_FINISH:
+            return self.compressor.finish()
+        return self.compressor.flush()
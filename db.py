@@ -0,0 +1,120 @@
+"""Engine cache and tenant database URLs."""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, create_engine
+
+from querylog import install_slow_query_log
+
+TENANT_KEY = re.compile(r'[A-Za-z0-9_-]{1,64}')
+
+# Set by tenancy once the tenant's shard is known to exist; None means the default DATABASE_URL
+current_tenant: ContextVar[str | None] = ContextVar('current_tenant', default=None)
+
+
+class TenantError(Exception):
+    """Raised when a tenant key can't be mapped to a database."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.message = message
+
+
+class TenantNotFoundError(TenantError):
+    """Raised when a well-formed tenant key has no shard."""
+
+    def __init__(self, tenant: str) -> None:
+        """Initialize the error."""
+        super().__init__(f'Unknown tenant: {tenant!r}.')
+
+
+class EngineCache:
+    """Bounded LRU of engines by URL; the least recently used engine is disposed when the cache is full."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self._engines: OrderedDict[str, Engine] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, database_url: str) -> Engine | None:
+        """Return the cached engine and mark it as recently used."""
+        with self._lock:
+            engine = self._engines.get(database_url)
+            if engine is not None:
+                self._engines.move_to_end(database_url)
+            return engine
+
+    def add(self, database_url: str, engine: Engine) -> Engine:
+        """Cache an engine, keeping the existing one if another thread got there first."""
+        with self._lock:
+            if database_url in self._engines:
+                engine.dispose()
+                return self._engines[database_url]
+            self._engines[database_url] = engine
+            evicted = self._engines.popitem(last=False)[1] if len(self._engines) > self.max_size else None
+        if evicted is not None:
+            # Checked-out connections finish normally; only the idle pool is closed
+            evicted.dispose()
+        return engine
+
+    def values(self) -> list[Engine]:
+        """Snapshot of the cached engines."""
+        with self._lock:
+            return list(self._engines.values())
+
+    def __contains__(self, database_url: str) -> bool:
+        """Whether an engine for the URL is cached."""
+        return database_url in self._engines
+
+    def __len__(self) -> int:
+        """Number of cached engines."""
+        return len(self._engines)
+
+
+engines = EngineCache(int(os.getenv('MAX_ENGINES', '32')))
+
+
+def get_engine(database_url: str = None) -> Engine:
+    """Get the shared engine for a database URL, creating it on first use.
+
+    Without a URL, the current tenant's shard is used if one is set, otherwise DATABASE_URL.
+    """
+    if database_url is None:
+        tenant = current_tenant.get()
+        database_url = tenant_database_url(tenant) if tenant is not None else os.getenv('DATABASE_URL')
+    engine = engines.get(database_url)
+    if engine is None:
+        engine = engines.add(database_url, create_engine(database_url))
+        if os.getenv('SLOW_QUERY_MS'):
+            install_slow_query_log(engine, float(os.getenv('SLOW_QUERY_MS')))
+    return engine
+
+
+def dispose_engines() -> None:
+    """Drop pooled connections inherited from a parent process after fork."""
+    for engine in engines.values():
+        engine.dispose(close=False)
+
+
+def tenant_database_url(tenant: str) -> str:
+    """Database URL of a tenant's shard, from the TENANT_DATABASE_URL template."""
+    template = os.getenv('TENANT_DATABASE_URL')
+    if not template:
+        raise TenantError('TENANT_DATABASE_URL is not set.')
+    # The key ends up in a file name or database name, so only allow a safe alphabet
+    if not TENANT_KEY.fullmatch(tenant):
+        raise TenantError(f'Invalid tenant key: {tenant!r}.')
+    return template.format(tenant=tenant)
+
+
+def allowed_tenants() -> set[str] | None:
+    """The TENANTS allowlist, or None when it isn't set."""
+    if not os.getenv('TENANTS'):
+        return None
+    return {tenant.strip() for tenant in os.getenv('TENANTS').split(',') if tenant.strip()}
@@ -0,0 +1,116 @@
+"""In-process change-event bus."""
+
+import threading
+from collections import deque
+from typing import NamedTuple
+
+from db import current_tenant
+
+DEFAULT_QUEUE_SIZE = 100
+
+
+class ChangeEvent(NamedTuple):
+    """A change to one entity, or to many when id is None.
+
+    A campaign_id of None means the change can affect every campaign. The tenant is set by EventBus.publish.
+    """
+
+    entity: str
+    id: int | None
+    op: str
+    campaign_id: int | None = None
+    tenant: str | None = None
+
+
+class Subscription:
+    """A subscriber's bounded event queue; the oldest events are dropped on overflow."""
+
+    def __init__(self, bus: 'EventBus', campaign_id: int | None, maxsize: int, tenant: str | None = None) -> None:
+        """Initialize the subscription."""
+        self.bus = bus
+        self.campaign_id = campaign_id
+        self.tenant = tenant
+        self.dropped = 0
+        self._events: deque[ChangeEvent] = deque(maxlen=maxsize)
+        self._condition = threading.Condition()
+
+    def __enter__(self) -> 'Subscription':
+        """Use the subscription as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Unsubscribe on exit."""
+        self.close()
+
+    def matches(self, event: ChangeEvent) -> bool:
+        """Check whether the event is from this subscription's tenant and passes its campaign filter."""
+        if event.tenant != self.tenant:
+            return False
+        return self.campaign_id is None or event.campaign_id in (None, self.campaign_id)
+
+    def put(self, event: ChangeEvent) -> None:
+        """Queue an event without blocking the publisher."""
+        with self._condition:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+            self._condition.notify()
+
+    def get(self, timeout: float | None = None) -> ChangeEvent | None:
+        """Wait for the next event, returning None on timeout."""
+        with self._condition:
+            if not self._events:
+                self._condition.wait(timeout)
+            return self._events.popleft() if self._events else None
+
+    def take_dropped(self) -> int:
+        """Return and reset the number of events dropped since the last call."""
+        with self._condition:
+            dropped, self.dropped = self.dropped, 0
+            return dropped
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """Fan change events out to every matching subscriber."""
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        """Initialize the bus."""
+        self.queue_size = queue_size
+        self._subscribers: set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscriptions."""
+        return len(self._subscribers)
+
+    def subscribe(
+        self, campaign_id: int | None = None, maxsize: int | None = None, tenant: str | None = None
+    ) -> Subscription:
+        """Subscribe to all of a tenant's events, or only those for one campaign; None is the default database."""
+        subscription = Subscription(self, campaign_id, maxsize or self.queue_size, tenant)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, event: ChangeEvent) -> None:
+        """Deliver an event to every matching subscriber in the publisher's tenant."""
+        # Campaign ids are only unique within a shard, so the tenant is part of every match
+        event = event._replace(tenant=current_tenant.get())
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            if subscription.matches(event):
+                subscription.put(event)
+
+
+event_bus = EventBus()
@@ -0,0 +1,181 @@
+"""Per-endpoint memory profiling with tracemalloc.
+
+tracemalloc is process-wide, so the figures are only exact when requests don't overlap; profile with a single
+worker thread (the dev server with threaded=False, or gunicorn --workers 1 --threads 1).
+"""
+
+import gc
+import os
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Callable, NamedTuple
+
+from flask import Blueprint, Flask, Response, current_app, g, jsonify, request
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Allocation sites kept per endpoint, so the profiler's own memory stays bounded
+MAX_SITES = 200
+
+# tracemalloc's own bookkeeping shows up in every snapshot diff; skipping it here is much cheaper than filter_traces
+IGNORED_FILES = frozenset({tracemalloc.__file__, '<frozen importlib._bootstrap>', '<unknown>'})
+
+memory_bp = Blueprint('memory', __name__)
+
+
+def allocation_site(traceback: tracemalloc.Traceback) -> str:
+    """The innermost frame in this project's code, or the innermost frame if the allocation never left a library."""
+    for frame in reversed(traceback):
+        if frame.filename.startswith(PROJECT_DIR) and 'site-packages' not in frame.filename:
+            return f'{os.path.relpath(frame.filename, PROJECT_DIR)}:{frame.lineno}'
+    return str(traceback[-1])
+
+
+class AllocationSite(NamedTuple):
+    """Net memory allocated from one line of project code."""
+
+    site: str
+    size_bytes: int
+    count: int
+
+
+class EndpointMemory:
+    """Running memory figures for one endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize empty figures."""
+        self.requests = 0
+        self.peak_bytes_max = 0
+        self.peak_bytes_total = 0
+        self.last_peak_bytes = 0
+        self.retained_bytes_total = 0
+        self.site_sizes: Counter[str] = Counter()
+        self.site_counts: Counter[str] = Counter()
+
+    def add(self, peak_bytes: int, retained_bytes: int, diffs: list[tracemalloc.StatisticDiff]) -> None:
+        """Fold one request into the figures."""
+        self.requests += 1
+        self.peak_bytes_max = max(self.peak_bytes_max, peak_bytes)
+        self.peak_bytes_total += peak_bytes
+        self.last_peak_bytes = peak_bytes
+        self.retained_bytes_total += retained_bytes
+        for diff in diffs:
+            if diff.traceback[-1].filename in IGNORED_FILES:
+                continue
+            site = allocation_site(diff.traceback)
+            self.site_sizes[site] += diff.size_diff
+            self.site_counts[site] += diff.count_diff
+        if len(self.site_sizes) > MAX_SITES:
+            keep = dict(self.site_sizes.most_common(MAX_SITES))
+            self.site_sizes = Counter(keep)
+            self.site_counts = Counter({site: self.site_counts[site] for site in keep})
+
+    def top_sites(self, limit: int) -> list[AllocationSite]:
+        """The sites that allocated the most memory across the requests."""
+        return [AllocationSite(site, size, self.site_counts[site]) for site, size in self.site_sizes.most_common(limit)]
+
+    def to_dict(self, top: int) -> dict:
+        """JSON-ready summary."""
+        return {
+            'requests': self.requests,
+            'peak_bytes_max': self.peak_bytes_max,
+            'peak_bytes_mean': self.peak_bytes_total // self.requests if self.requests else 0,
+            'last_peak_bytes': self.last_peak_bytes,
+            'retained_bytes_total': self.retained_bytes_total,
+            'top_sites': [site._asdict() for site in self.top_sites(top)],
+        }
+
+
+def current_rss() -> int | None:
+    """Resident set size of this process in bytes, if the platform exposes it."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+class MemoryProfiler:
+    """Record peak and retained memory plus the top allocation sites for every endpoint."""
+
+    def __init__(self, app: Flask | None = None) -> None:
+        """Initialize the extension."""
+        self.endpoints: dict[str, EndpointMemory] = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """Start tracing and register the request hooks and the /admin/memory endpoint."""
+        app.config.setdefault('MEMORY_PROFILE_TOP', int(os.getenv('MEMORY_PROFILE_TOP', '10')))
+        # Deep enough to get from SQLAlchemy/Jinja internals back to the service or view that called them
+        app.config.setdefault('MEMORY_PROFILE_FRAMES', int(os.getenv('MEMORY_PROFILE_FRAMES', '16')))
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(app.config['MEMORY_PROFILE_FRAMES'])
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+        app.extensions['memory_profiler'] = self
+        app.register_blueprint(memory_bp)
+
+    def before_request(self) -> None:
+        """Snapshot the heap and reset the peak before the view runs."""
+        if request.endpoint in (None, 'static') or request.endpoint.startswith('memory.'):
+            return
+        # Collect first so garbage from earlier requests isn't counted as freed by this one
+        gc.collect()
+        tracemalloc.reset_peak()
+        g.memory_start = (tracemalloc.get_traced_memory()[0], tracemalloc.take_snapshot())
+
+    def after_request(self, response: Response) -> Response:
+        """Measure once the body has been sent, so streamed responses are included."""
+        start = g.pop('memory_start', None)
+        if start is not None:
+            response.call_on_close(self._recorder(request.endpoint, *start))
+        return response
+
+    def _recorder(self, endpoint: str, start_bytes: int, start_snapshot: tracemalloc.Snapshot) -> Callable[[], None]:
+        """Build the on-close callback for one request."""
+
+        def record() -> None:
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            # Reference cycles freed by the collector aren't a leak
+            gc.collect()
+            current_bytes = tracemalloc.get_traced_memory()[0]
+            diffs = [diff for diff in tracemalloc.take_snapshot().compare_to(start_snapshot, 'traceback') if diff.size_diff]
+            with self._lock:
+                stats = self.endpoints.setdefault(endpoint, EndpointMemory())
+                stats.add(peak_bytes - start_bytes, current_bytes - start_bytes, diffs)
+
+        return record
+
+    def report(self, top: int) -> dict:
+        """Process-wide and per-endpoint memory figures."""
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        with self._lock:
+            endpoints = {name: stats.to_dict(top) for name, stats in sorted(self.endpoints.items())}
+        return {
+            'rss_bytes': current_rss(),
+            'traced_current_bytes': current_bytes,
+            'traced_peak_bytes': peak_bytes,
+            'endpoints': endpoints,
+        }
+
+    def reset(self) -> None:
+        """Forget the figures collected so far."""
+        with self._lock:
+            self.endpoints.clear()
+
+
+@memory_bp.get('/admin/memory')
+def memory_report() -> Response:
+    """Per-endpoint peak memory and top allocation sites."""
+    profiler = current_app.extensions['memory_profiler']
+    return jsonify(profiler.report(request.args.get('top', current_app.config['MEMORY_PROFILE_TOP'], type=int)))
+
+
+@memory_bp.delete('/admin/memory')
+def reset_memory_report() -> Response:
+    """Start collecting from scratch."""
+    current_app.extensions['memory_profiler'].reset()
+    return jsonify({'success': True})
@@ -1,50 +1,85 @@
 """Database models."""
 
-import os
 from contextlib import contextmanager
 from typing import Generator, List, Optional
 
-from sqlmodel import Field, Session, SQLModel, create_engine, Relationship
+from sqlalchemy import Engine, inspect, text
+from sqlalchemy.orm import declared_attr
+from sqlmodel import Field, Session, SQLModel, Relationship
 
+from db import get_engine
 
-def create_db(database_url: str = None) -> None:
+# Bump whenever the table definitions change so fast startup re-runs create_all
+SCHEMA_VERSION = 2
+
+
+def get_schema_version(engine: Engine) -> int | None:
+    """Read the stored schema version, or None if the backend can't store one."""
+    if engine.dialect.name != 'sqlite':
+        return None
+    with engine.connect() as connection:
+        return connection.execute(text('PRAGMA user_version')).scalar()
+
+
+def create_db(database_url: str = None, skip_if_current: bool = False) -> None:
     """Create the database."""
-    if database_url is None:
-        database_url = os.getenv('DATABASE_URL')
-    engine = create_engine(database_url)
+    engine = get_engine(database_url)
+    if skip_if_current and get_schema_version(engine) == SCHEMA_VERSION:
+        return
     SQLModel.metadata.create_all(engine)
+    _add_version_columns(engine)
+    if engine.dialect.name == 'sqlite':
+        with engine.begin() as connection:
+            connection.execute(text(f'PRAGMA user_version = {SCHEMA_VERSION}'))
+
+
+def _add_version_columns(engine: Engine) -> None:
+    """Add the optimistic locking column to tables created before schema version 2."""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in ('player', 'campaign', 'character'):
+            if 'version' not in {column['name'] for column in inspector.get_columns(table)}:
+                connection.execute(text(f'ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 1'))
 
 
 @contextmanager
 def get_session(database_url: str = None) -> Generator[Session, None, None]:
     """Get a database session."""
-    if database_url is None:
-        database_url = os.getenv('DATABASE_URL')
-    engine = create_engine(database_url)
-    with Session(engine) as session:
+    with Session(get_engine(database_url)) as session:
         yield session
 
 
-class Campaign(SQLModel, table=True):
+class Versioned:
+    """Mixin enabling optimistic locking on the model's version column."""
+
+    @declared_attr
+    def __mapper_args__(cls) -> dict:
+        """Make every UPDATE check and bump the version."""
+        return {'version_id_col': cls.__table__.c.version}
+
+
+class Campaign(Versioned, SQLModel, table=True):
     """Campaign model."""
     id: int | None = Field(default=None, primary_key=True)
     name: str
     is_active: bool = True
+    version: int | None = Field(default=None, sa_column_kwargs={'nullable': False, 'server_default': '1'})
     characters: List["Character"] = Relationship(back_populates="campaign")
 
 
-class Character(SQLModel, table=True):
+class Character(Versioned, SQLModel, table=True):
     """Character model."""
     id: int | None = Field(default=None, primary_key=True)
     character_name: str
     player_id: int = Field(foreign_key="player.id")
     is_alive: bool = True
     campaign_id: int = Field(foreign_key="campaign.id")
+    version: int | None = Field(default=None, sa_column_kwargs={'nullable': False, 'server_default': '1'})
     player: "Player" = Relationship(back_populates="characters")
     campaign: "Campaign" = Relationship(back_populates="characters")
 
 
-class Player(SQLModel, table=True):
+class Player(Versioned, SQLModel, table=True):
     """Player model."""
 
     id: int | None = Field(primary_key=True, index=True)
@@ -54,4 +89,5 @@ class Player(SQLModel, table=True):
     password_attempts: int | None = 0
     reset_password: bool | None = False
     is_active: bool | None = True
+    version: int | None = Field(default=None, sa_column_kwargs={'nullable': False, 'server_default': '1'})
     characters: List["Character"] = Relationship(back_populates="player")
@@ -0,0 +1,51 @@
+"""Opt-in slow-query logging for SQLAlchemy engines."""
+
+import logging
+import os
+import sys
+import time
+import weakref
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+SERVICES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'services')
+
+_instrumented: weakref.WeakSet[Engine] = weakref.WeakSet()
+
+
+def calling_service_method() -> str | None:
+    """Qualified name of the innermost service method on the current stack."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(SERVICES_DIR):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return None
+
+
+def install_slow_query_log(engine: Engine, threshold_ms: float) -> None:
+    """Log every statement on the engine that takes at least threshold_ms."""
+    if engine in _instrumented:
+        return
+    _instrumented.add(engine)
+
+    def start_timer(connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool) -> None:
+        # The context lives for one execution, so a statement that raises leaves nothing behind on the connection
+        context._query_start = time.perf_counter()
+
+    def log_if_slow(connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool) -> None:
+        elapsed_ms = (time.perf_counter() - context._query_start) * 1000
+        if elapsed_ms >= threshold_ms:
+            logger.warning(
+                'Slow query (%.1f ms) from %s: %s %r',
+                elapsed_ms,
+                calling_service_method() or 'unknown caller',
+                statement,
+                parameters,
+            )
+
+    event.listen(engine, 'before_cursor_execute', start_timer)
+    event.listen(engine, 'after_cursor_execute', log_if_slow)
@@ -0,0 +1,160 @@
+"""Run every service query under EXPLAIN and flag full table scans."""
+
+from typing import Any, Callable, NamedTuple
+
+from sqlalchemy import Connection, Engine, event, func, select
+from sqlmodel import Session
+
+from models import Campaign, Character, Player
+from services.campaign_service import CampaignService
+from services.character_service import CharacterService
+from services.player_service import PlayerService
+
+
+class SampleIds(NamedTuple):
+    """Existing IDs to pass to the service methods."""
+
+    player_id: int
+    campaign_id: int
+    other_campaign_id: int
+    character_id: int
+
+
+class ExplainedQuery(NamedTuple):
+    """One statement issued by a service method, with its plan."""
+
+    method: str
+    statement: str
+    plan: list[str]
+    full_scans: list[str]
+
+
+def _service_calls(ids: SampleIds) -> list[tuple[str, Callable[[Session], Any]]]:
+    """Every service method with sample arguments; writes come last as they change the data."""
+    player, campaign, character = ids.player_id, ids.campaign_id, ids.character_id
+    return [
+        ('PlayerService.list_players', lambda s: PlayerService(s).list_players()),
+        ('PlayerService.get_player', lambda s: PlayerService(s).get_player(player)),
+        ('PlayerService.get_player_roster', lambda s: PlayerService(s).get_player_roster(player)),
+        ('PlayerService.iter_player_rosters', lambda s: list(PlayerService(s).iter_player_rosters())),
+        ('CampaignService.list_campaigns', lambda s: CampaignService(s).list_campaigns()),
+        ('CampaignService.get_campaign', lambda s: CampaignService(s).get_campaign(campaign)),
+        ('CharacterService.list_characters', lambda s: CharacterService(s).list_characters()),
+        ('CharacterService.list_character_rows', lambda s: CharacterService(s).list_character_rows()),
+        (
+            'CharacterService.list_character_rows(filtered)',
+            lambda s: CharacterService(s).list_character_rows(campaign_id=campaign, player_id=player, is_alive=True),
+        ),
+        (
+            'CharacterService.list_characters_in_campaign',
+            lambda s: CharacterService(s).list_characters_in_campaign(campaign),
+        ),
+        ('CharacterService.get_character', lambda s: CharacterService(s).get_character(character)),
+        (
+            'PlayerService.add_player',
+            lambda s: PlayerService(s).add_player(Player(name='Explain', email='explain@example.com', password='x')),
+        ),
+        (
+            'PlayerService.update_player',
+            lambda s: PlayerService(s).update_player(player, Player(name='Explain', email='explain@example.com')),
+        ),
+        ('CampaignService.add_campaign', lambda s: CampaignService(s).add_campaign(Campaign(name='Explain'))),
+        (
+            'CampaignService.update_campaign',
+            lambda s: CampaignService(s).update_campaign(campaign, Campaign(name='Explain')),
+        ),
+        (
+            'CharacterService.add_character',
+            lambda s: CharacterService(s).add_character(
+                Character(character_name='Explain', player_id=player, campaign_id=campaign)
+            ),
+        ),
+        (
+            'CharacterService.update_character',
+            lambda s: CharacterService(s).update_character(
+                character, Character(character_name='Explain', player_id=player, campaign_id=campaign)
+            ),
+        ),
+        (
+            'CharacterService.bulk_update',
+            lambda s: CharacterService(s).bulk_update(where={'player_id': player}, values={'is_alive': False}),
+        ),
+        (
+            'CampaignService.reassign_characters',
+            lambda s: CampaignService(s).reassign_characters(campaign, ids.other_campaign_id),
+        ),
+        ('CampaignService.close_campaign', lambda s: CampaignService(s).close_campaign(campaign, kill_characters=True)),
+        ('CharacterService.delete_character', lambda s: CharacterService(s).delete_character(character)),
+        ('CampaignService.delete_campaign', lambda s: CampaignService(s).delete_campaign(campaign)),
+        ('PlayerService.delete_player', lambda s: PlayerService(s).delete_player(player)),
+    ]
+
+
+def _sample_ids(connection: Connection) -> SampleIds:
+    """Pick existing rows so lookups exercise real data, falling back to ID 1."""
+
+    def first_id(model: type, offset: int = 0) -> int:
+        statement = select(model.id).order_by(model.id).offset(offset).limit(1)
+        return connection.execute(statement).scalar() or 1 + offset
+
+    return SampleIds(first_id(Player), first_id(Campaign), first_id(Campaign, 1), first_id(Character))
+
+
+def find_full_scans(dialect: str, plan: list[str]) -> list[str]:
+    """Plan lines that read a whole table rather than using an index."""
+    if dialect == 'sqlite':
+        return [line for line in plan if line.startswith('SCAN ') and ' USING ' not in line]
+    return [line for line in plan if 'Seq Scan' in line or 'Full scan' in line or 'ALL' in line.split()]
+
+
+def _explain(connection: Connection, statement: str, parameters: Any) -> list[str]:
+    """Run EXPLAIN (QUERY PLAN on SQLite) for a captured statement."""
+    if connection.dialect.name == 'sqlite':
+        rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+        return [row[-1] for row in rows]
+    rows = connection.exec_driver_sql(f'EXPLAIN {statement}', parameters).all()
+    return [' '.join(str(value) for value in row) for row in rows]
+
+
+def explain_service_queries(engine: Engine) -> list[ExplainedQuery]:
+    """Run each service method inside a rolled-back transaction and explain every statement it issues."""
+    results: list[ExplainedQuery] = []
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            ids = _sample_ids(connection)
+            for method, call in _service_calls(ids):
+                captured: list[tuple[str, Any]] = []
+                error = None
+
+                def capture(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool) -> None:
+                    if not statement.lstrip().upper().startswith(('SAVEPOINT', 'RELEASE', 'ROLLBACK', 'EXPLAIN')):
+                        captured.append((statement, parameters[0] if many else parameters))
+
+                # Service commits only release a savepoint, so nothing outlives the outer transaction
+                session = Session(bind=connection, join_transaction_mode='create_savepoint')
+                event.listen(connection, 'before_cursor_execute', capture)
+                try:
+                    call(session)
+                except Exception as e:  # a failing method shouldn't hide the plans of the others
+                    error = ExplainedQuery(method, f'-- {type(e).__name__}: {e}', [], [])
+                finally:
+                    event.remove(connection, 'before_cursor_execute', capture)
+                    session.close()
+                for statement, parameters in captured:
+                    plan = _explain(connection, statement, parameters)
+                    results.append(ExplainedQuery(method, statement, plan, find_full_scans(connection.dialect.name, plan)))
+                if error:
+                    results.append(error)
+        finally:
+            transaction.rollback()
+    return results
+
+
+def count_rows(engine: Engine) -> dict[str, int]:
+    """Row counts per table, to put the plans in context."""
+    with engine.connect() as connection:
+        return {
+            model.__tablename__: connection.execute(select(func.count()).select_from(model)).scalar()
+            for model in (Player, Campaign, Character)
+        }
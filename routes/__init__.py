@@ -0,0 +1,11 @@
+"""Route blueprints."""
+
+from flask import flash
+from flask_wtf import FlaskForm
+
+
+def flash_form_errors(form: FlaskForm) -> None:
+    """Flash every validation error of a form that redirects instead of re-rendering."""
+    for errors in form.errors.values():
+        for error in errors:
+            flash(error, 'danger')
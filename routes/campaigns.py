@@ -1,12 +1,15 @@
 """Campaign routes blueprint."""
 
-from flask import Blueprint, jsonify, redirect, render_template, url_for
+from flask import Blueprint, Response, abort, flash, jsonify, redirect, render_template, request, url_for
 from flask_wtf import FlaskForm
-from wtforms import BooleanField, StringField
+from wtforms import BooleanField, IntegerField, SelectField, StringField
 from wtforms.validators import InputRequired
+from wtforms.widgets import HiddenInput
 
 from models import Campaign, get_session
-from services.campaign_service import CampaignService
+from routes import flash_form_errors
+from schemas import CampaignCreate, CampaignUpdate, JsonRequestError, load_json
+from services.campaign_service import CampaignConflictError, CampaignNotFoundError, CampaignService
 
 campaigns_bp = Blueprint('campaigns', __name__)
 
@@ -21,6 +24,22 @@ class EditCampaignForm(FlaskForm):
     """Edit campaign form."""
     name = StringField('Name', validators=[InputRequired()])
     is_active = BooleanField('Active')
+    version = IntegerField(widget=HiddenInput(), validators=[InputRequired()])
+
+
+class CloseCampaignForm(FlaskForm):
+    """Close campaign form."""
+    kill_characters = BooleanField('Mark all characters dead')
+
+
+class ReassignCharactersForm(FlaskForm):
+    """Reassign characters form."""
+    to_campaign_id = SelectField('Move all characters to', validators=[InputRequired()], coerce=int)
+
+
+def _reassign_choices(service: CampaignService, campaign_id: int) -> list[tuple[int, str]]:
+    """Campaigns other than the given one, for the reassign dropdown."""
+    return [(c.id, c.name) for c in service.list_campaigns() if c.id != campaign_id]
 
 
 @campaigns_bp.get('/campaigns')
@@ -41,6 +60,8 @@ def add_campaign_form() -> str:
 @campaigns_bp.post('/campaigns')
 def add_campaign() -> str:
     """Add a new campaign."""
+    if request.is_json:
+        return _add_campaign_json()
     form = AddCampaignForm()
     if form.validate_on_submit():
         with get_session() as session:
@@ -50,6 +71,18 @@ def add_campaign() -> str:
     return render_template('campaigns/campaign_add.html', form=form)
 
 
+def _add_campaign_json() -> tuple[Response, int]:
+    """Add a campaign from a JSON body."""
+    try:
+        data = load_json(CampaignCreate)
+    except JsonRequestError as e:
+        return e.response()
+    with get_session() as session:
+        service = CampaignService(session)
+        campaign = service.add_campaign(Campaign(**data.model_dump()))
+        return jsonify(campaign.model_dump()), 201
+
+
 @campaigns_bp.get('/campaigns/<int:campaign_id>/edit')
 def edit_campaign_form(campaign_id: int) -> str:
     """Render the edit campaign form."""
@@ -62,19 +95,92 @@ def edit_campaign_form(campaign_id: int) -> str:
 
         form.name.data = campaign.name
         form.is_active.data = campaign.is_active
-        return render_template('campaigns/campaign_edit.html', form=form, campaign=campaign)
+        form.version.data = campaign.version
+        reassign_form = ReassignCharactersForm()
+        reassign_form.to_campaign_id.choices = _reassign_choices(service, campaign_id)
+        return render_template(
+            'campaigns/campaign_edit.html',
+            form=form,
+            campaign=campaign,
+            close_form=CloseCampaignForm(),
+            reassign_form=reassign_form,
+        )
 
 
 @campaigns_bp.post('/campaigns/<int:campaign_id>')
 def edit_campaign(campaign_id: int) -> str:
     """Update a campaign by ID."""
+    if request.is_json:
+        return _edit_campaign_json(campaign_id)
     form = EditCampaignForm()
     if form.validate_on_submit():
         with get_session() as session:
             service = CampaignService(session)
-            service.update_campaign(campaign_id, Campaign(**form.data))
+            try:
+                service.update_campaign(campaign_id, Campaign(**form.data))
+            except CampaignConflictError as e:
+                # Show the current values so the user can re-apply their edit
+                campaign = service.get_campaign(campaign_id)
+                form = EditCampaignForm(formdata=None, obj=campaign)
+                form.form_errors.append(e.message)
+                return render_template('campaigns/campaign_edit.html', form=form, campaign=campaign), 409
             return redirect(url_for('campaigns.list_campaigns'))
-    return render_template('campaigns/campaign_edit.html', form=form)
+    return render_template('campaigns/campaign_edit.html', form=form, campaign={'id': campaign_id})
+
+
+def _edit_campaign_json(campaign_id: int) -> tuple[Response, int]:
+    """Update a campaign from a JSON body."""
+    try:
+        data = load_json(CampaignUpdate)
+    except JsonRequestError as e:
+        return e.response()
+    with get_session() as session:
+        service = CampaignService(session)
+        try:
+            campaign = service.update_campaign(campaign_id, Campaign(**data.model_dump()))
+        except CampaignNotFoundError as e:
+            return jsonify({'error': e.message}), 404
+        except CampaignConflictError as e:
+            return jsonify({'error': e.message, 'current': service.get_campaign(campaign_id).model_dump()}), 409
+        return jsonify(campaign.model_dump()), 200
+
+
+@campaigns_bp.post('/campaigns/<int:campaign_id>/close')
+def close_campaign(campaign_id: int) -> str:
+    """Archive a campaign, optionally marking its characters dead."""
+    form = CloseCampaignForm()
+    if form.validate_on_submit():
+        with get_session() as session:
+            service = CampaignService(session)
+            try:
+                result = service.close_campaign(campaign_id, kill_characters=form.kill_characters.data)
+            except CampaignNotFoundError as e:
+                abort(404, e.message)
+            message = 'Campaign closed.'
+            if form.kill_characters.data:
+                message = f'Campaign closed and {result.characters} characters marked dead.'
+            flash(message, 'success')
+    else:
+        flash_form_errors(form)
+    return redirect(url_for('campaigns.list_campaigns'))
+
+
+@campaigns_bp.post('/campaigns/<int:campaign_id>/reassign')
+def reassign_characters(campaign_id: int) -> str:
+    """Move every character in a campaign to another campaign."""
+    form = ReassignCharactersForm()
+    with get_session() as session:
+        service = CampaignService(session)
+        form.to_campaign_id.choices = _reassign_choices(service, campaign_id)
+        if form.validate_on_submit():
+            try:
+                count = service.reassign_characters(campaign_id, form.to_campaign_id.data)
+            except CampaignNotFoundError as e:
+                abort(404, e.message)
+            flash(f'Moved {count} characters.', 'success')
+            return redirect(url_for('characters.list_characters', campaign_id=form.to_campaign_id.data))
+        flash_form_errors(form)
+    return redirect(url_for('campaigns.edit_campaign_form', campaign_id=campaign_id))
 
 
 @campaigns_bp.delete('/campaigns/<int:campaign_id>')
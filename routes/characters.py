@@ -1,13 +1,17 @@
 """Character routes blueprint."""
 
-from flask import Blueprint, jsonify, redirect, render_template, url_for
+from flask import Blueprint, Response, flash, jsonify, redirect, render_template, request, url_for
 from flask_wtf import FlaskForm
-from wtforms import BooleanField, IntegerField, SelectField, StringField
+from sqlmodel import Session
+from wtforms import BooleanField, IntegerField, SelectField, SelectMultipleField, StringField
 from wtforms.validators import InputRequired
+from wtforms.widgets import HiddenInput
 
 from models import Campaign, Character, Player, get_session
+from routes import flash_form_errors
+from schemas import CharacterCreate, CharacterUpdate, JsonRequestError, load_json
 from services.campaign_service import CampaignService
-from services.character_service import CharacterService
+from services.character_service import CharacterConflictError, CharacterNotFoundError, CharacterService
 from services.player_service import PlayerService
 
 characters_bp = Blueprint('characters', __name__)
@@ -27,15 +31,67 @@ class EditCharacterForm(FlaskForm):
     player_id = SelectField('Player', validators=[InputRequired()], coerce=int)
     campaign_id = SelectField('Campaign', validators=[InputRequired()], coerce=int)
     is_alive = BooleanField('Is Alive')
+    version = IntegerField(widget=HiddenInput(), validators=[InputRequired()])
+
+
+class BulkCharacterForm(FlaskForm):
+    """Bulk character action form."""
+    character_ids = SelectMultipleField(
+        'Characters', coerce=int, validate_choice=False, validators=[InputRequired('Select at least one character')]
+    )
+    action = SelectField('Action', choices=[('kill', 'Mark dead'), ('revive', 'Mark alive'), ('move', 'Move to campaign')])
+    campaign_id = SelectField('Campaign', coerce=int)
+
+
+BULK_ACTION_VALUES = {'kill': {'is_alive': False}, 'revive': {'is_alive': True}}
+
+
+def _set_choices(form: AddCharacterForm | EditCharacterForm, session: Session) -> None:
+    """Fill the player and campaign dropdowns from (id, name) column queries."""
+    form.player_id.choices = PlayerService(session).list_player_choices()
+    form.campaign_id.choices = CampaignService(session).list_campaign_choices()
+
+
+def _unknown_references(session: Session, data: CharacterCreate) -> tuple[Response, int] | None:
+    """Reject JSON requests pointing at a missing player or campaign."""
+    if session.get(Player, data.player_id) is None or session.get(Campaign, data.campaign_id) is None:
+        return jsonify({'error': 'Unknown player or campaign.'}), 400
+    return None
 
 
 @characters_bp.get('/characters')
 def list_characters() -> str:
-    """List all characters."""
+    """List all characters, optionally filtered by campaign, player or alive status."""
+    is_alive = request.args.get('is_alive')
     with get_session() as session:
         service = CharacterService(session)
-        characters = service.list_characters()
-        return render_template('characters/character_list.html', characters=characters)
+        characters = service.list_character_rows(
+            campaign_id=request.args.get('campaign_id', type=int),
+            player_id=request.args.get('player_id', type=int),
+            is_alive=None if is_alive is None else is_alive.lower() in ('1', 'true', 'yes'),
+        )
+        bulk_form = BulkCharacterForm()
+        bulk_form.campaign_id.choices = CampaignService(session).list_campaign_choices()
+        return render_template('characters/character_list.html', characters=characters, bulk_form=bulk_form)
+
+
+@characters_bp.post('/characters/bulk')
+def bulk_update_characters() -> str:
+    """Apply one action to all selected characters with a single UPDATE."""
+    form = BulkCharacterForm()
+    with get_session() as session:
+        form.campaign_id.choices = CampaignService(session).list_campaign_choices()
+        if form.validate_on_submit():
+            if form.action.data == 'move':
+                values = {'campaign_id': form.campaign_id.data}
+            else:
+                values = BULK_ACTION_VALUES[form.action.data]
+            service = CharacterService(session)
+            count = service.bulk_update(where={'id': form.character_ids.data}, values=values)
+            flash(f'Updated {count} characters.', 'success')
+        else:
+            flash_form_errors(form)
+    return redirect(url_for('characters.list_characters'))
 
 
 @characters_bp.get('/characters/add')
@@ -43,14 +99,7 @@ def add_character_form() -> str:
     """Render the add character form."""
     form = AddCharacterForm()
     with get_session() as session:
-        # Get players and campaigns for dropdowns
-        player_service = PlayerService(session)
-        campaign_service = CampaignService(session)
-        players = player_service.list_players()
-        campaigns = campaign_service.list_campaigns()
-
-        form.player_id.choices = [(p.id, p.name) for p in players]
-        form.campaign_id.choices = [(c.id, c.name) for c in campaigns]
+        _set_choices(form, session)
 
     return render_template('characters/character_add.html', form=form)
 
@@ -58,16 +107,12 @@ def add_character_form() -> str:
 @characters_bp.post('/characters')
 def add_character() -> str:
     """Add a new character."""
+    if request.is_json:
+        return _add_character_json()
     form = AddCharacterForm()
     with get_session() as session:
         # Populate choices for validation
-        player_service = PlayerService(session)
-        campaign_service = CampaignService(session)
-        players = player_service.list_players()
-        campaigns = campaign_service.list_campaigns()
-
-        form.player_id.choices = [(p.id, p.name) for p in players]
-        form.campaign_id.choices = [(c.id, c.name) for c in campaigns]
+        _set_choices(form, session)
 
         if form.validate_on_submit():
             # Clean form data before creating character
@@ -84,14 +129,26 @@ def add_character() -> str:
     return render_template('characters/character_add.html', form=form)
 
 
+def _add_character_json() -> tuple[Response, int]:
+    """Add a character from a JSON body."""
+    try:
+        data = load_json(CharacterCreate)
+    except JsonRequestError as e:
+        return e.response()
+    with get_session() as session:
+        if error := _unknown_references(session, data):
+            return error
+        service = CharacterService(session)
+        character = service.add_character(Character(**data.model_dump()))
+        return jsonify(character.model_dump()), 201
+
+
 @characters_bp.get('/characters/<int:character_id>/edit')
 def edit_character_form(character_id: int) -> str:
     """Render the edit character form."""
     form = EditCharacterForm()
     with get_session() as session:
         service = CharacterService(session)
-        player_service = PlayerService(session)
-        campaign_service = CampaignService(session)
 
         # Get current character
         character = service.get_character(character_id)
@@ -99,32 +156,26 @@ def edit_character_form(character_id: int) -> str:
             return redirect(url_for('characters.list_characters'))
 
         # Populate choices
-        players = player_service.list_players()
-        campaigns = campaign_service.list_campaigns()
-        form.player_id.choices = [(p.id, p.name) for p in players]
-        form.campaign_id.choices = [(c.id, c.name) for c in campaigns]
+        _set_choices(form, session)
 
         # Set form data
         form.character_name.data = character.character_name
         form.player_id.data = character.player_id
         form.campaign_id.data = character.campaign_id
         form.is_alive.data = character.is_alive
+        form.version.data = character.version
         return render_template('characters/character_edit.html', form=form, character=character)
 
 
 @characters_bp.post('/characters/<int:character_id>')
 def edit_character(character_id: int) -> str:
     """Update a character by ID."""
+    if request.is_json:
+        return _edit_character_json(character_id)
     form = EditCharacterForm()
     with get_session() as session:
         # Populate choices for validation
-        player_service = PlayerService(session)
-        campaign_service = CampaignService(session)
-        players = player_service.list_players()
-        campaigns = campaign_service.list_campaigns()
-
-        form.player_id.choices = [(p.id, p.name) for p in players]
-        form.campaign_id.choices = [(c.id, c.name) for c in campaigns]
+        _set_choices(form, session)
 
         if form.validate_on_submit():
             service = CharacterService(session)
@@ -132,14 +183,41 @@ def edit_character(character_id: int) -> str:
                 'character_name': form.character_name.data,
                 'player_id': form.player_id.data,
                 'campaign_id': form.campaign_id.data,
-                'is_alive': form.is_alive.data
+                'is_alive': form.is_alive.data,
+                'version': form.version.data,
             }
-            service.update_character(character_id, Character(**character_data))
+            try:
+                service.update_character(character_id, Character(**character_data))
+            except CharacterConflictError as e:
+                character = service.get_character(character_id)
+                form = EditCharacterForm(formdata=None, obj=character)
+                _set_choices(form, session)
+                form.form_errors.append(e.message)
+                return render_template('characters/character_edit.html', form=form, character=character), 409
             return redirect(url_for('characters.list_characters'))
 
         return render_template('characters/character_edit.html', form=form, character={'id': character_id})
 
 
+def _edit_character_json(character_id: int) -> tuple[Response, int]:
+    """Update a character from a JSON body."""
+    try:
+        data = load_json(CharacterUpdate)
+    except JsonRequestError as e:
+        return e.response()
+    with get_session() as session:
+        if error := _unknown_references(session, data):
+            return error
+        service = CharacterService(session)
+        try:
+            character = service.update_character(character_id, Character(**data.model_dump()))
+        except CharacterNotFoundError as e:
+            return jsonify({'error': e.message}), 404
+        except CharacterConflictError as e:
+            return jsonify({'error': e.message, 'current': service.get_character(character_id).model_dump()}), 409
+        return jsonify(character.model_dump()), 200
+
+
 @characters_bp.delete('/characters/<int:character_id>')
 def delete_character(character_id: int) -> str:
     """Delete a character by ID."""
@@ -1,12 +1,29 @@
 """Player routes blueprint."""
 
-from flask import Blueprint, jsonify, redirect, render_template, url_for
+import json
+from typing import Iterator
+
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
 from flask_wtf import FlaskForm
-from wtforms import BooleanField, PasswordField, StringField
+from sqlmodel import Session
+from wtforms import BooleanField, IntegerField, PasswordField, StringField
 from wtforms.validators import Email, InputRequired
+from wtforms.widgets import HiddenInput
 
-from models import Player, get_session
-from services.player_service import PlayerService
+from models import Player, get_engine, get_session
+from schemas import JsonRequestError, PlayerCreate, PlayerUpdate, load_json
+from services.player_service import PlayerConflictError, PlayerNotFoundError, PlayerRoster, PlayerService
 
 players_bp = Blueprint('players', __name__)
 
@@ -28,6 +45,7 @@ class EditPlayerForm(FlaskForm):
     new_password = PasswordField('New Password')
     reset_password = BooleanField('Reset Password')
     is_active = BooleanField('Active')
+    version = IntegerField(widget=HiddenInput(), validators=[InputRequired()])
 
 
 @players_bp.get('/players')
@@ -48,25 +66,87 @@ def add_player_form() -> str:
 @players_bp.post('/players')
 def add_player() -> str:
     """Add a new player."""
+    if request.is_json:
+        return _add_player_json()
     form = AddPlayerForm()
-    try:
-        if form.validate_on_submit():
-            with get_session() as session:
-                service = PlayerService(session)
-                service.add_player(Player(**form.data))
-                return redirect(url_for('players.list_players'))
-    except Exception as e:
-        print(f"Error validating form: {e}")
+    if form.validate_on_submit():
+        with get_session() as session:
+            service = PlayerService(session)
+            service.add_player(Player(**form.data))
+            return redirect(url_for('players.list_players'))
+    current_app.logger.info('Add player form errors: %s', form.errors)
     return render_template('players/player_add.html', form=form)
 
 
+def _add_player_json() -> tuple[Response, int]:
+    """Add a player from a JSON body."""
+    try:
+        data = load_json(PlayerCreate)
+    except JsonRequestError as e:
+        return e.response()
+    with get_session() as session:
+        service = PlayerService(session)
+        player = service.add_player(Player(**data.model_dump()))
+        return jsonify(player.model_dump(exclude={'password'})), 201
+
+
 @players_bp.get('/players/<int:player_id>')
 def get_player(player_id: int) -> str:
     """Get a player by ID."""
     with get_session() as session:
         service = PlayerService(session)
-        player = service.get_player(player_id)
-        return jsonify(player)
+        try:
+            player = service.get_player(player_id)
+        except PlayerNotFoundError as e:
+            return jsonify({'error': e.message}), 404
+        return jsonify(player.model_dump(exclude={'password'}))
+
+
+def _roster_to_dict(roster: PlayerRoster) -> dict:
+    """Convert a roster into a JSON-serializable dict."""
+    return {**roster._asdict(), 'characters': [character._asdict() for character in roster.characters]}
+
+
+@players_bp.get('/players/<int:player_id>/roster')
+def player_roster(player_id: int) -> str:
+    """Show a player's characters across campaigns."""
+    with get_session() as session:
+        service = PlayerService(session)
+        try:
+            roster = service.get_player_roster(player_id)
+        except PlayerNotFoundError:
+            return redirect(url_for('players.list_players'))
+        return render_template('players/player_roster.html', roster=roster)
+
+
+@players_bp.get('/players/<int:player_id>/roster.json')
+def player_roster_json(player_id: int) -> str:
+    """Get a player's roster as JSON."""
+    with get_session() as session:
+        service = PlayerService(session)
+        try:
+            roster = service.get_player_roster(player_id)
+        except PlayerNotFoundError as e:
+            return jsonify({'error': e.message}), 404
+        return jsonify(_roster_to_dict(roster))
+
+
+@players_bp.get('/players/rosters.json')
+def export_rosters() -> Response:
+    """Stream every player's roster as a JSON array."""
+
+    # Resolve the tenant's shard now; the generator runs after the request hooks have finished
+    engine = get_engine()
+
+    def generate() -> Iterator[str]:
+        with Session(engine) as session:
+            service = PlayerService(session)
+            yield '['
+            for index, roster in enumerate(service.iter_player_rosters()):
+                yield (',' if index else '') + json.dumps(_roster_to_dict(roster))
+            yield ']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @players_bp.get('/players/<int:player_id>/edit')
@@ -75,43 +155,71 @@ def edit_player_form(player_id: int) -> str:
     form = EditPlayerForm()
     with get_session() as session:
         service = PlayerService(session)
-        player = service.get_player(player_id)
-        if not player:
+        try:
+            player = service.get_player(player_id)
+        except PlayerNotFoundError:
             return redirect(url_for('players.list_players'))
 
         form.email.data = player.email
         form.name.data = player.name
         form.reset_password.data = player.reset_password
         form.is_active.data = player.is_active
+        form.version.data = player.version
         return render_template('players/player_edit.html', form=form, player=player)
 
 
 @players_bp.post('/players/<int:player_id>')
 def edit_player(player_id: int) -> str:
     """Update a player by ID."""
+    if request.is_json:
+        return _edit_player_json(player_id)
     form = EditPlayerForm()
-    try:
-        if form.validate_on_submit():
-            with get_session() as session:
-                service = PlayerService(session)
+    if form.validate_on_submit():
+        with get_session() as session:
+            service = PlayerService(session)
+            try:
                 existing_player = service.get_player(player_id)
-                data = form.data
-                player_data = {
-                    'email': data['email'],
-                    'name': data['name'],
-                    'current_password': data['current_password'],
-                    'new_password': data['new_password'],
-                    'password_attempts': existing_player.password_attempts,  # Preserve existing value
-                    'reset_password': data['reset_password'],
-                    'is_active': data['is_active'],
-                }
+            except PlayerNotFoundError as e:
+                abort(404, e.message)
+            data = form.data
+            player_data = {
+                'email': data['email'],
+                'name': data['name'],
+                'current_password': data['current_password'],
+                'new_password': data['new_password'],
+                'password_attempts': existing_player.password_attempts,  # Preserve existing value
+                'reset_password': data['reset_password'],
+                'is_active': data['is_active'],
+                'version': data['version'],
+            }
+            try:
                 service.update_player(player_id, Player(**player_data))
-                return redirect(url_for('players.list_players'))
-        else:
-            print(f"Form errors: {form.errors}")
-    except Exception as e:
-        print(f"Error validating form: {e}")
-    return jsonify({'error': 'Invalid request'}), 400
+            except PlayerConflictError as e:
+                player = service.get_player(player_id)
+                form = EditPlayerForm(formdata=None, obj=player)
+                form.form_errors.append(e.message)
+                return render_template('players/player_edit.html', form=form, player=player), 409
+            return redirect(url_for('players.list_players'))
+    current_app.logger.info('Edit player form errors: %s', form.errors)
+    return render_template('players/player_edit.html', form=form, player={'id': player_id}), 400
+
+
+def _edit_player_json(player_id: int) -> tuple[Response, int]:
+    """Update a player from a JSON body."""
+    try:
+        data = load_json(PlayerUpdate)
+    except JsonRequestError as e:
+        return e.response()
+    with get_session() as session:
+        service = PlayerService(session)
+        try:
+            player = service.update_player(player_id, Player(**data.model_dump()))
+        except PlayerNotFoundError as e:
+            return jsonify({'error': e.message}), 404
+        except PlayerConflictError as e:
+            current = service.get_player(player_id).model_dump(exclude={'password'})
+            return jsonify({'error': e.message, 'current': current}), 409
+        return jsonify(player.model_dump(exclude={'password'})), 200
 
 
 @players_bp.delete('/players/<int:player_id>')
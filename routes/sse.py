@@ -0,0 +1,50 @@
+"""Server-Sent Events blueprint."""
+
+import json
+from typing import Iterator
+
+from flask import Blueprint, Response, current_app, request
+
+from db import current_tenant
+from events import Subscription, event_bus
+
+events_bp = Blueprint('events', __name__)
+
+# Comment lines keep idle connections open through proxies
+HEARTBEAT_SECONDS = 15
+
+
+def event_stream(subscription: Subscription, heartbeat: float = HEARTBEAT_SECONDS) -> Iterator[str]:
+    """Yield SSE messages for a subscription until the client disconnects."""
+    try:
+        yield 'retry: 5000\n\n'
+        while True:
+            event = subscription.get(timeout=heartbeat)
+            dropped = subscription.take_dropped()
+            if dropped:
+                # The client missed events and should reload rather than trust its state
+                yield f'event: overflow\ndata: {json.dumps({"dropped": dropped})}\n\n'
+            if event is None:
+                yield ': keep-alive\n\n'
+                continue
+            data = event._asdict()
+            # The subscriber only ever sees its own tenant's events, so the tenant isn't sent
+            del data['tenant']
+            yield f'event: change\ndata: {json.dumps(data)}\n\n'
+    finally:
+        subscription.close()
+
+
+@events_bp.get('/events')
+def stream_events() -> Response:
+    """Stream change events, optionally only those for one campaign."""
+    if not current_app.config['LIVE_UPDATES']:
+        # 204 tells EventSource to stop reconnecting
+        return Response(status=204)
+    campaign_id = request.args.get('campaign_id', type=int)
+    subscription = event_bus.subscribe(campaign_id=campaign_id, tenant=current_tenant.get())
+    return Response(
+        event_stream(subscription),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
@@ -0,0 +1,92 @@
+"""Pydantic request schemas for the JSON variants of the form endpoints."""
+
+from typing import Annotated, TypeVar
+
+from flask import Response, current_app, jsonify, request
+from flask_wtf.csrf import validate_csrf
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints, ValidationError
+from wtforms.validators import ValidationError as CSRFError
+
+Name = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+SchemaT = TypeVar('SchemaT', bound=BaseModel)
+
+
+class RequestSchema(BaseModel):
+    """Base schema: unknown keys are rejected."""
+
+    model_config = ConfigDict(extra='forbid')
+
+
+class PlayerCreate(RequestSchema):
+    """Add player request."""
+
+    name: Name
+    email: EmailStr
+    password: Name
+
+
+class PlayerUpdate(RequestSchema):
+    """Edit player request."""
+
+    name: Name
+    email: EmailStr
+    reset_password: bool = False
+    is_active: bool = True
+    version: int
+
+
+class CampaignCreate(RequestSchema):
+    """Add campaign request."""
+
+    name: Name
+    is_active: bool = True
+
+
+class CampaignUpdate(CampaignCreate):
+    """Edit campaign request."""
+
+    version: int
+
+
+class CharacterCreate(RequestSchema):
+    """Add character request."""
+
+    character_name: Name
+    player_id: int
+    campaign_id: int
+    is_alive: bool = True
+
+
+class CharacterUpdate(CharacterCreate):
+    """Edit character request."""
+
+    version: int
+
+
+class JsonRequestError(Exception):
+    """Raised when a JSON request fails CSRF or schema validation."""
+
+    def __init__(self, errors: list[dict]) -> None:
+        """Initialize the error."""
+        super().__init__('Invalid JSON request.')
+        self.errors = errors
+        self.message = 'Invalid JSON request.'
+
+    def response(self) -> tuple[Response, int]:
+        """The 400 response describing what was wrong."""
+        return jsonify({'error': self.message, 'errors': self.errors}), 400
+
+
+def load_json(schema: type[SchemaT]) -> SchemaT:
+    """Check the X-CSRFToken header, then validate the raw request body against a schema."""
+    if current_app.config.get('WTF_CSRF_ENABLED', True):
+        try:
+            validate_csrf(request.headers.get('X-CSRFToken'))
+        except CSRFError as e:
+            raise JsonRequestError([{'loc': ['X-CSRFToken'], 'msg': str(e)}])
+    try:
+        # Parsing straight from bytes skips the intermediate dict that request.get_json() would build
+        return schema.model_validate_json(request.get_data())
+    except ValidationError as e:
+        raise JsonRequestError(e.errors(include_url=False, include_context=False, include_input=False))
@@ -0,0 +1,64 @@
+"""Compare time and memory of the ORM character listing against the lightweight row listing."""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlmodel import Session  # noqa: E402
+
+from models import Campaign, Character, Player, create_db, get_engine  # noqa: E402
+from services.character_service import CharacterService  # noqa: E402
+
+
+def populate(session: Session, rows: int) -> None:
+    """Insert players, campaigns and the requested number of characters."""
+    session.execute(Player.__table__.insert(), [
+        {'id': i, 'email': f'p{i}@example.com', 'password': 'x', 'name': f'Player {i}'} for i in range(1, 101)
+    ])
+    session.execute(Campaign.__table__.insert(), [{'id': i, 'name': f'Campaign {i}'} for i in range(1, 21)])
+    session.execute(Character.__table__.insert(), [
+        {'character_name': f'Character {i}', 'player_id': i % 100 + 1, 'campaign_id': i % 20 + 1, 'is_alive': i % 7 != 0}
+        for i in range(rows)
+    ])
+    session.commit()
+
+
+def measure(label: str, listing: Callable[[], list], rows: int) -> None:
+    """Run a listing once and print elapsed time and peak traced memory."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = listing()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    scale = 100_000 / rows
+    print(f'{label:<8}{len(result):>10}{elapsed * scale:>14.3f}{peak * scale / 2**20:>14.1f}')
+
+
+def main() -> None:
+    """Benchmark both listing paths against an in-memory database."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    database_url = 'sqlite://'
+    create_db(database_url)
+    with Session(get_engine(database_url)) as session:
+        populate(session, args.rows)
+
+    print(f'{"path":<8}{"rows":>10}{"s/100k":>14}{"MiB/100k":>14}')
+    with Session(get_engine(database_url)) as session:
+        measure('orm', CharacterService(session).list_characters, args.rows)
+    with Session(get_engine(database_url)) as session:
+        measure('rows', CharacterService(session).list_character_rows, args.rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compare WTForms and pydantic validation of an edit-character request, CSRF check included."""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flask import Flask  # noqa: E402
+from flask_wtf.csrf import generate_csrf, validate_csrf  # noqa: E402
+from werkzeug.datastructures import MultiDict  # noqa: E402
+
+from routes.characters import EditCharacterForm  # noqa: E402
+from schemas import CharacterUpdate  # noqa: E402
+
+CHOICES = [(i, f'Name {i}') for i in range(1, 51)]
+
+
+def measure(label: str, validate: Callable[[], object], iterations: int) -> None:
+    """Print mean time and peak traced memory per validation."""
+    validate()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        validate()
+    elapsed = (time.perf_counter() - start) / iterations
+    tracemalloc.start()
+    validate()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:<10}{elapsed * 1e6:>12.1f}{peak / 1024:>14.1f}')
+
+
+def main() -> None:
+    """Validate the same payload through both paths inside one request context."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=20_000)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.secret_key = 'bench'
+    payload = {'character_name': 'Aragorn', 'player_id': 3, 'campaign_id': 7, 'is_alive': True, 'version': 4}
+
+    with app.test_request_context(method='POST'):
+        token = generate_csrf()
+        formdata = MultiDict({**{k: str(v) for k, v in payload.items()}, 'is_alive': 'y', 'csrf_token': token})
+        body = json.dumps(payload).encode()
+
+        def wtforms_path() -> bool:
+            form = EditCharacterForm(formdata=formdata)
+            form.player_id.choices = CHOICES
+            form.campaign_id.choices = CHOICES
+            return form.validate()
+
+        def pydantic_path() -> CharacterUpdate:
+            validate_csrf(token)
+            return CharacterUpdate.model_validate_json(body)
+
+        assert wtforms_path() and pydantic_path()
+        print(f'{"path":<10}{"us/op":>12}{"peak KiB/op":>14}')
+        measure('wtforms', wtforms_path, args.iterations)
+        measure('pydantic', pydantic_path, args.iterations)
+
+
+if __name__ == '__main__':
+    main()
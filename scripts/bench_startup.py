@@ -0,0 +1,57 @@
+"""Benchmark cold start of create_app() in the normal and fast startup modes."""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in a fresh interpreter so every sample pays the full import cost
+SNIPPET = '''
+import time
+start = time.perf_counter()
+from app import create_app
+app = create_app()
+client = app.test_client()
+booted = time.perf_counter()
+client.get('/')
+print(booted - start, time.perf_counter() - start)
+'''
+
+
+def run_once(env: dict[str, str]) -> tuple[float, float]:
+    """Start the app in a new process and return (boot, boot + first request) seconds."""
+    output = subprocess.run(
+        [sys.executable, '-c', SNIPPET], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    boot, first_request = output.split()
+    return float(boot), float(first_request)
+
+
+def main() -> None:
+    """Print median startup timings for each mode."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_env = {**os.environ, 'DATABASE_URL': f'sqlite:///{tmp}/bench.db'}
+        modes = {
+            'default': base_env,
+            'fast': {**base_env, 'FAST_STARTUP': '1', 'TEMPLATE_CACHE_DIR': f'{tmp}/jinja'},
+        }
+        print(f'{"mode":<10}{"boot ms":>12}{"first req ms":>16}')
+        for name, env in modes.items():
+            run_once(env)  # warm the schema and template cache
+            samples = [run_once(env) for _ in range(args.runs)]
+            boot = statistics.median(s[0] for s in samples) * 1000
+            first = statistics.median(s[1] for s in samples) * 1000
+            print(f'{name:<10}{boot:>12.1f}{first:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
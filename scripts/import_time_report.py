@@ -0,0 +1,41 @@
+"""Report the slowest imports triggered by loading the app module."""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def collect(statement: str) -> list[tuple[int, int, str]]:
+    """Run a statement under -X importtime and return (self us, cumulative us, module) rows."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix('import time:').split('|')
+        rows.append((int(self_us), int(cumulative_us), module.rstrip()))
+    return rows
+
+
+def main() -> None:
+    """Print the top imports by cumulative time."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--top', type=int, default=25)
+    parser.add_argument('--statement', default='import app')
+    args = parser.parse_args()
+
+    rows = collect(args.statement)
+    total = sum(row[0] for row in rows)
+    print(f'{args.statement!r}: {len(rows)} modules, {total / 1000:.1f} ms total')
+    print(f'{"self ms":>10}{"cumul ms":>10}  module')
+    for self_us, cumulative_us, module in sorted(rows, key=lambda row: row[1], reverse=True)[: args.top]:
+        print(f'{self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}  {module}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Simple closed-loop HTTP load generator for comparing server configurations."""
+
+import argparse
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+
+DEFAULT_PATHS = ['/', '/players', '/campaigns', '/characters']
+
+
+def worker(base_url: str, paths: list[str], deadline: float, latencies: list[float], errors: list[int]) -> None:
+    """Request the paths round-robin until the deadline."""
+    index = 0
+    while time.perf_counter() < deadline:
+        url = base_url + paths[index % len(paths)]
+        index += 1
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                response.read()
+        except (urllib.error.URLError, OSError):
+            errors.append(1)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the load test and print throughput and latency percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--path', action='append', dest='paths', help='repeatable, defaults to the list pages')
+    args = parser.parse_args()
+
+    latencies: list[float] = []
+    errors: list[int] = []
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=worker, args=(args.url, args.paths or DEFAULT_PATHS, deadline, latencies, errors))
+        for _ in range(args.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if not latencies:
+        raise SystemExit(f'No successful requests ({len(errors)} errors)')
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f'requests={len(latencies)} errors={len(errors)} rps={len(latencies) / args.duration:.1f} '
+        f'p50={quantiles[49] * 1000:.1f}ms p95={quantiles[94] * 1000:.1f}ms p99={quantiles[98] * 1000:.1f}ms'
+    )
+
+
+if __name__ == '__main__':
+    main()
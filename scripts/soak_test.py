@@ -0,0 +1,102 @@
+"""Request every GET route in-process for a while and fail if the process keeps growing."""
+
+import argparse
+import gc
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flask import Flask  # noqa: E402
+
+from memprofile import current_rss  # noqa: E402
+
+# Endpoints that never finish (SSE) or only exist in profiling mode
+SKIPPED_ENDPOINTS = {'events.stream_events', 'memory.memory_report'}
+
+
+def soak_paths(app: Flask) -> list[str]:
+    """A concrete URL for every GET route, using ID 1 for integer arguments."""
+    paths = []
+    for rule in app.url_map.iter_rules():
+        if 'GET' not in rule.methods or rule.endpoint in SKIPPED_ENDPOINTS:
+            continue
+        if re.search(r'<(?!int:)', rule.rule):
+            continue
+        paths.append(re.sub(r'<int:\w+>', '1', rule.rule))
+    return sorted(paths)
+
+
+def rss_mib() -> float:
+    """Resident set size after a full collection, in MiB."""
+    gc.collect()
+    return (current_rss() or 0) / 2**20
+
+
+def main() -> int:
+    """Seed a scratch database, warm up, then hit every route until the time is up."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--minutes', type=float, default=5)
+    parser.add_argument('--threshold-mb', type=float, default=20, help='allowed RSS growth after warm-up')
+    parser.add_argument('--warmup', type=float, default=15, help='seconds before the baseline is taken')
+    parser.add_argument('--sample-every', type=float, default=30, help='seconds between RSS samples')
+    parser.add_argument('--players', type=int, default=500)
+    parser.add_argument('--campaigns', type=int, default=50)
+    parser.add_argument('--characters', type=int, default=5_000)
+    args = parser.parse_args()
+
+    os.environ['DATABASE_URL'] = f'sqlite:///{tempfile.mkdtemp()}/soak.db'
+    from app import create_app
+    from models import get_engine
+    from seeding import seed_database
+
+    app = create_app(fast_startup=False, memory_profile=False)
+    seed_database(get_engine(), args.players, args.campaigns, args.characters)
+    client = app.test_client()
+    paths = soak_paths(app)
+    print(f'Soaking {len(paths)} routes: {", ".join(paths)}')
+
+    def run_for(seconds: float) -> tuple[int, list[str]]:
+        requests, errors = 0, []
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            for path in paths:
+                response = client.get(path)
+                response.get_data()
+                response.close()
+                requests += 1
+                if response.status_code >= 500:
+                    errors.append(f'{path} -> {response.status_code}')
+        return requests, errors
+
+    run_for(args.warmup)
+    baseline = rss_mib()
+    print(f'{"elapsed":>8}{"requests":>10}{"rss MiB":>10}{"growth":>10}')
+    print(f'{0:>7.0f}s{0:>10}{baseline:>10.1f}{0:>10.1f}')
+
+    total, all_errors, elapsed = 0, [], 0.0
+    while elapsed < args.minutes * 60:
+        step = min(args.sample_every, args.minutes * 60 - elapsed)
+        requests, errors = run_for(step)
+        total, elapsed = total + requests, elapsed + step
+        all_errors += errors
+        rss = rss_mib()
+        print(f'{elapsed:>7.0f}s{total:>10}{rss:>10.1f}{rss - baseline:>10.1f}')
+
+    growth = rss_mib() - baseline
+    if all_errors:
+        print(f'FAIL: {len(all_errors)} server errors, first: {all_errors[0]}')
+        return 1
+    if growth > args.threshold_mb:
+        print(f'FAIL: RSS grew {growth:.1f} MiB after warm-up (threshold {args.threshold_mb} MiB)')
+        return 1
+    print(f'OK: RSS grew {growth:.1f} MiB after warm-up (threshold {args.threshold_mb} MiB)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Deterministic generator for large, realistic test datasets."""
+
+import random
+import time
+from itertools import accumulate, islice
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from sqlalchemy import Engine, Table, func, select
+
+from models import Campaign, Character, Player
+
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Robin', 'Drew', 'Quinn', 'Avery']
+LAST_NAMES = ['Smith', 'Nguyen', 'Garcia', 'Okafor', 'Kowalski', 'Tanaka', 'Silva', 'Murphy', 'Haddad', 'Larsen']
+SYLLABLES = ['ar', 'dor', 'el', 'thra', 'ka', 'zin', 'mor', 'va', 'lin', 'gar', 'oth', 'ri', 'sa', 'bel', 'un']
+CAMPAIGN_WORDS = ['Curse', 'Lost', 'Mines', 'Storm', 'Crown', 'Tomb', 'Shadow', 'Dragon', 'Keep', 'Abyss', 'Sea', 'Vault']
+
+# A Pareto shape near 1.16 gives the classic 80/20 split: most characters belong to a few prolific players
+PLAYER_SKEW = 1.16
+
+
+class SeedResult(NamedTuple):
+    """Rows inserted into one table and how long it took."""
+
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Insert throughput."""
+        return self.rows / self.seconds if self.seconds else float('inf')
+
+
+def _next_id(engine: Engine, table: Table) -> int:
+    """First unused primary key, so seeding can add to an existing database."""
+    with engine.connect() as connection:
+        return (connection.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def generate_players(rng: random.Random, first_id: int, count: int) -> Iterator[dict]:
+    """Generate player rows."""
+    for player_id in range(first_id, first_id + count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        yield {
+            'id': player_id,
+            'name': f'{first} {last}',
+            'email': f'{first.lower()}.{last.lower()}{player_id}@example.com',
+            'password': 'seeded',
+            'password_attempts': 0,
+            'reset_password': False,
+            'is_active': rng.random() < 0.9,
+        }
+
+
+def generate_campaigns(rng: random.Random, first_id: int, count: int) -> Iterator[dict]:
+    """Generate campaign rows."""
+    for campaign_id in range(first_id, first_id + count):
+        words = rng.sample(CAMPAIGN_WORDS, 2)
+        yield {'id': campaign_id, 'name': f'The {words[0]} of the {words[1]} #{campaign_id}', 'is_active': rng.random() < 0.7}
+
+
+def generate_characters(
+    rng: random.Random, player_ids: range, campaign_ids: range, count: int, batch_size: int
+) -> Iterator[list[dict]]:
+    """Generate character rows in batches, skewed towards a few players and large campaigns."""
+    player_weights = list(accumulate(rng.paretovariate(PLAYER_SKEW) for _ in player_ids))
+    # Log-normal campaign sizes: many small tables and a handful of long-running ones
+    campaign_weights = list(accumulate(rng.lognormvariate(0, 1) for _ in campaign_ids))
+    remaining = count
+    while remaining:
+        size = min(batch_size, remaining)
+        players = rng.choices(player_ids, cum_weights=player_weights, k=size)
+        campaigns = rng.choices(campaign_ids, cum_weights=campaign_weights, k=size)
+        yield [
+            {
+                'character_name': ''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize(),
+                'player_id': player_id,
+                'campaign_id': campaign_id,
+                'is_alive': rng.random() < 0.85,
+            }
+            for player_id, campaign_id in zip(players, campaigns)
+        ]
+        remaining -= size
+
+
+def _batched(rows: Iterable[dict], batch_size: int) -> Iterator[list[dict]]:
+    """Split rows into lists of at most batch_size."""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _insert(engine: Engine, table: Table, batches: Iterable[list[dict]]) -> SeedResult:
+    """Insert batches with executemany core inserts, one transaction per batch."""
+    rows = 0
+    start = time.perf_counter()
+    for batch in batches:
+        with engine.begin() as connection:
+            connection.execute(table.insert(), batch)
+        rows += len(batch)
+    return SeedResult(table.name, rows, time.perf_counter() - start)
+
+
+def _sync_sequences(engine: Engine, tables: Iterable[Table]) -> None:
+    """Move PostgreSQL id sequences past the explicitly inserted ids, so later inserts don't collide."""
+    if engine.dialect.name != 'postgresql':
+        return
+    with engine.begin() as connection:
+        for table in tables:
+            last_id = select(func.max(table.c.id)).scalar_subquery()
+            connection.execute(select(func.setval(func.pg_get_serial_sequence(table.name, 'id'), last_id)))
+
+
+def seed_database(
+    engine: Engine,
+    players: int,
+    campaigns: int,
+    characters: int,
+    seed: int = 0,
+    batch_size: int = 10_000,
+    progress: Callable[[SeedResult], None] | None = None,
+) -> list[SeedResult]:
+    """Populate the database with generated players, campaigns and characters."""
+    if characters and not (players and campaigns):
+        raise ValueError('Characters need at least one player and one campaign.')
+    rng = random.Random(seed)
+    player_table, campaign_table, character_table = Player.__table__, Campaign.__table__, Character.__table__
+    first_player_id, first_campaign_id = _next_id(engine, player_table), _next_id(engine, campaign_table)
+
+    results = []
+    for table, batches in (
+        (player_table, _batched(generate_players(rng, first_player_id, players), batch_size)),
+        (campaign_table, _batched(generate_campaigns(rng, first_campaign_id, campaigns), batch_size)),
+        (character_table, generate_characters(
+            rng,
+            range(first_player_id, first_player_id + players),
+            range(first_campaign_id, first_campaign_id + campaigns),
+            characters,
+            batch_size,
+        )),
+    ):
+        result = _insert(engine, table, batches)
+        results.append(result)
+        if progress:
+            progress(result)
+    _sync_sequences(engine, (player_table, campaign_table))
+    return results
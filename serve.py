@@ -0,0 +1,110 @@
+"""Production launcher: serves create_app() with multiple gunicorn worker processes."""
+
+import argparse
+import multiprocessing
+import os
+import warnings
+from typing import Any
+
+from flask import Flask
+from gunicorn.app.base import BaseApplication
+
+from app import create_app
+from db import dispose_engines
+
+
+def default_workers() -> int:
+    """Gunicorn's recommended worker count for the current machine."""
+    return multiprocessing.cpu_count() * 2 + 1
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Discard database connections the worker inherited from the preloaded master."""
+    dispose_engines()
+
+
+def live_updates_enabled(args: argparse.Namespace) -> bool:
+    """Whether /events can deliver every change: events stay in one process and each stream holds a thread."""
+    return args.live_updates or (args.workers == 1 and args.threads > 1)
+
+
+class FlaskApplication(BaseApplication):
+    """Gunicorn application that builds the app with create_app()."""
+
+    def __init__(self, options: dict[str, Any], live_updates: bool = False) -> None:
+        """Initialize with gunicorn settings."""
+        self.options = options
+        self.live_updates = live_updates
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Apply the settings to gunicorn's config."""
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Flask:
+        """Create the WSGI app, once in the master when preloading."""
+        app = create_app()
+        app.config['LIVE_UPDATES'] = self.live_updates
+        return app
+
+
+def build_options(args: argparse.Namespace) -> dict[str, Any]:
+    """Translate command line arguments into gunicorn settings."""
+    workers = 1 if args.live_updates else args.workers
+    if not live_updates_enabled(args):
+        reasons = []
+        if args.workers > 1:
+            reasons.append('change events only reach /events streams in the worker that saved the change')
+        if args.threads == 1:
+            reasons.append('a sync worker is blocked by an /events stream until --timeout kills it')
+        warnings.warn(
+            f'Live updates are off: {"; ".join(reasons)}. Use --live-updates to serve from one gthread worker.',
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    return {
+        'bind': args.bind,
+        'workers': workers,
+        'threads': args.threads,
+        # Threads need the gthread worker; SSE connections each hold one thread
+        'worker_class': 'gthread' if args.threads > 1 else 'sync',
+        'preload_app': args.preload,
+        'post_fork': post_fork,
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests_jitter,
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'keepalive': args.keepalive,
+        'accesslog': args.access_log,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse launcher arguments, defaulting from the environment."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--bind', default=os.getenv('BIND', '0.0.0.0:8000'))
+    parser.add_argument('--workers', type=int, default=int(os.getenv('WEB_CONCURRENCY', default_workers())))
+    parser.add_argument('--threads', type=int, default=int(os.getenv('THREADS', '4')))
+    parser.add_argument('--no-preload', dest='preload', action='store_false', help='import the app in each worker')
+    parser.add_argument('--max-requests', type=int, default=int(os.getenv('MAX_REQUESTS', '1000')))
+    parser.add_argument('--max-requests-jitter', type=int, default=int(os.getenv('MAX_REQUESTS_JITTER', '100')))
+    parser.add_argument('--timeout', type=int, default=int(os.getenv('WORKER_TIMEOUT', '30')))
+    parser.add_argument('--graceful-timeout', type=int, default=int(os.getenv('GRACEFUL_TIMEOUT', '30')))
+    parser.add_argument('--keepalive', type=int, default=int(os.getenv('KEEPALIVE', '5')))
+    parser.add_argument('--access-log', default=os.getenv('ACCESS_LOG'), help="file path, or '-' for stdout")
+    parser.add_argument(
+        '--live-updates',
+        action='store_true',
+        default=os.getenv('LIVE_UPDATES', '').lower() in ('1', 'true', 'yes'),
+        help='serve /events from a single gthread worker; size --threads for open tabs plus concurrent requests',
+    )
+    args = parser.parse_args(argv)
+    if args.live_updates and args.threads < 2:
+        parser.error('--live-updates needs --threads 2 or more, as every open /events stream holds a thread')
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    FlaskApplication(build_options(args), live_updates=live_updates_enabled(args)).run()
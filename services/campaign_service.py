@@ -1,8 +1,14 @@
 """Campaign services."""
 
+from typing import NamedTuple
+
+from sqlalchemy import update
+from sqlalchemy.orm.exc import StaleDataError
 from sqlmodel import Session, select
 
+from events import ChangeEvent, event_bus
 from models import Campaign
+from services.character_service import character_update_statement
 
 
 class CampaignNotFoundError(Exception):
@@ -15,6 +21,23 @@ class CampaignNotFoundError(Exception):
         self.message = f'Campaign with ID {campaign_id} not found.'
 
 
+class CampaignConflictError(Exception):
+    """Custom error for a campaign changed since it was loaded for editing."""
+
+    def __init__(self, campaign_id: int) -> None:
+        """Initialize the error."""
+        super().__init__(f'Campaign with ID {campaign_id} was changed by someone else.')
+        self.campaign_id = campaign_id
+        self.message = f'Campaign with ID {campaign_id} was changed by someone else.'
+
+
+class CloseCampaignResult(NamedTuple):
+    """Rows affected by closing a campaign."""
+
+    campaigns: int
+    characters: int
+
+
 class CampaignService:
     """Service for campaign operations."""
 
@@ -26,11 +49,16 @@ class CampaignService:
         """List all campaigns."""
         return self.session.exec(select(Campaign)).all()
 
+    def list_campaign_choices(self) -> list[tuple[int, str]]:
+        """List (id, name) pairs for dropdowns without loading full campaigns."""
+        return [tuple(row) for row in self.session.exec(select(Campaign.id, Campaign.name).order_by(Campaign.name))]
+
     def add_campaign(self, campaign: Campaign) -> Campaign:
         """Add a new campaign."""
         self.session.add(campaign)
         self.session.commit()
         self.session.refresh(campaign)
+        event_bus.publish(ChangeEvent('campaign', campaign.id, 'create', campaign.id))
         return campaign
 
     def get_campaign(self, campaign_id: int) -> Campaign:
@@ -41,14 +69,22 @@ class CampaignService:
         return campaign
 
     def update_campaign(self, campaign_id: int, campaign_data: Campaign) -> Campaign:
-        """Update a campaign by ID."""
+        """Update a campaign by ID, rejecting edits made against an older version."""
         campaign = self.session.get(Campaign, campaign_id)
         if not campaign:
             raise CampaignNotFoundError(campaign_id)
-        for key, value in campaign_data.model_dump().items():
+        if campaign_data.version is not None and campaign_data.version != campaign.version:
+            raise CampaignConflictError(campaign_id)
+        for key, value in campaign_data.model_dump(exclude={'id', 'version'}).items():
             setattr(campaign, key, value)
-        self.session.commit()
+        try:
+            # The UPDATE matches on the loaded version, so a concurrent edit updates no rows
+            self.session.commit()
+        except StaleDataError:
+            self.session.rollback()
+            raise CampaignConflictError(campaign_id)
         self.session.refresh(campaign)
+        event_bus.publish(ChangeEvent('campaign', campaign_id, 'update', campaign_id))
         return campaign
 
     def delete_campaign(self, campaign_id: int) -> None:
@@ -58,3 +94,33 @@ class CampaignService:
             raise CampaignNotFoundError(campaign_id)
         self.session.delete(campaign)
         self.session.commit()
+        event_bus.publish(ChangeEvent('campaign', campaign_id, 'delete', campaign_id))
+
+    def close_campaign(self, campaign_id: int, kill_characters: bool = False) -> CloseCampaignResult:
+        """Archive a campaign and optionally mark all its characters dead."""
+        campaigns = self.session.connection().execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id)
+            .values(is_active=False, version=Campaign.version + 1)
+        ).rowcount
+        if not campaigns:
+            self.session.rollback()
+            raise CampaignNotFoundError(campaign_id)
+        characters = 0
+        if kill_characters:
+            statement = character_update_statement({'campaign_id': campaign_id, 'is_alive': True}, {'is_alive': False})
+            characters = self.session.connection().execute(statement).rowcount
+        self.session.commit()
+        event_bus.publish(ChangeEvent('campaign', campaign_id, 'close', campaign_id))
+        return CloseCampaignResult(campaigns, characters)
+
+    def reassign_characters(self, from_campaign_id: int, to_campaign_id: int) -> int:
+        """Move every character from one campaign to another and return the moved count."""
+        self.get_campaign(from_campaign_id)
+        self.get_campaign(to_campaign_id)
+        statement = character_update_statement({'campaign_id': from_campaign_id}, {'campaign_id': to_campaign_id})
+        count = self.session.connection().execute(statement).rowcount
+        self.session.commit()
+        for campaign_id in (from_campaign_id, to_campaign_id):
+            event_bus.publish(ChangeEvent('character', None, 'reassign', campaign_id))
+        return count
@@ -1,7 +1,12 @@
 """Character services."""
 
+from typing import NamedTuple
+
+from sqlalchemy import Update, update
+from sqlalchemy.orm.exc import StaleDataError
 from sqlmodel import Session, select
 
+from events import ChangeEvent, event_bus
 from models import Campaign, Character, Player
 
 
@@ -15,6 +20,40 @@ class CharacterNotFoundError(Exception):
         self.message = f'Character with ID {character_id} not found.'
 
 
+class CharacterConflictError(Exception):
+    """Custom error for a character changed since it was loaded for editing."""
+
+    def __init__(self, character_id: int) -> None:
+        """Initialize the error."""
+        super().__init__(f'Character with ID {character_id} was changed by someone else.')
+        self.character_id = character_id
+        self.message = f'Character with ID {character_id} was changed by someone else.'
+
+
+class CharacterRow(NamedTuple):
+    """Read-only character listing row."""
+
+    id: int
+    character_name: str
+    is_alive: bool
+    player_id: int
+    player_name: str
+    campaign_id: int
+    campaign_name: str
+
+
+def character_update_statement(where: dict[str, object], values: dict[str, object]) -> Update:
+    """Build a set-based UPDATE for characters; list/tuple/set filter values become IN clauses."""
+    unknown = (where.keys() | values.keys()) - Character.model_fields.keys()
+    if unknown or not where or 'id' in values or 'version' in values:
+        raise ValueError(f'Invalid bulk update of characters: where={where!r}, values={values!r}')
+    statement = update(Character).values(**values, version=Character.version + 1)
+    for key, value in where.items():
+        column = getattr(Character, key)
+        statement = statement.where(column.in_(value) if isinstance(value, (list, tuple, set)) else column == value)
+    return statement
+
+
 class CharacterService:
     """Service for character operations."""
 
@@ -32,6 +71,33 @@ class CharacterService:
         results = self.session.exec(statement).all()
         return results
 
+    def list_character_rows(
+        self, campaign_id: int | None = None, player_id: int | None = None, is_alive: bool | None = None
+    ) -> list[CharacterRow]:
+        """List characters as lightweight rows, filtered in SQL."""
+        statement = (
+            select(
+                Character.id,
+                Character.character_name,
+                Character.is_alive,
+                Character.player_id,
+                Player.name,
+                Character.campaign_id,
+                Campaign.name,
+            )
+            .join(Player, Character.player_id == Player.id)
+            .join(Campaign, Character.campaign_id == Campaign.id)
+            .order_by(Character.id)
+        )
+        if campaign_id is not None:
+            statement = statement.where(Character.campaign_id == campaign_id)
+        if player_id is not None:
+            statement = statement.where(Character.player_id == player_id)
+        if is_alive is not None:
+            statement = statement.where(Character.is_alive == is_alive)
+        # Column-only selects bypass the identity map, so rows are never tracked by the session
+        return [CharacterRow._make(row) for row in self.session.exec(statement)]
+
     def list_characters_in_campaign(self, campaign_id: int) -> list[Character]:
         """List all characters in a campaign."""
         return self.session.exec(select(Character).where(Character.campaign_id == campaign_id)).all()
@@ -41,6 +107,7 @@ class CharacterService:
         self.session.add(character)
         self.session.commit()
         self.session.refresh(character)
+        event_bus.publish(ChangeEvent('character', character.id, 'create', character.campaign_id))
         return character
 
     def get_character(self, character_id: int) -> Character:
@@ -51,20 +118,43 @@ class CharacterService:
         return character
 
     def update_character(self, character_id: int, character_data: Character) -> Character:
-        """Update a character by ID."""
+        """Update a character by ID, rejecting edits made against an older version."""
         character = self.session.get(Character, character_id)
         if not character:
             raise CharacterNotFoundError(character_id)
-        for key, value in character_data.model_dump().items():
+        if character_data.version is not None and character_data.version != character.version:
+            raise CharacterConflictError(character_id)
+        previous_campaign_id = character.campaign_id
+        for key, value in character_data.model_dump(exclude={'id', 'version'}).items():
             setattr(character, key, value)
-        self.session.commit()
+        try:
+            self.session.commit()
+        except StaleDataError:
+            self.session.rollback()
+            raise CharacterConflictError(character_id)
         self.session.refresh(character)
+        # A move between campaigns changes both rosters
+        for campaign_id in {previous_campaign_id, character.campaign_id}:
+            event_bus.publish(ChangeEvent('character', character_id, 'update', campaign_id))
         return character
 
+    def bulk_update(self, where: dict[str, object], values: dict[str, object]) -> int:
+        """Update every matching character with a single statement and return the affected count."""
+        count = self.session.connection().execute(character_update_statement(where, values)).rowcount
+        self.session.commit()
+        # Only a single-campaign filter can be routed; anything else goes to every subscriber
+        campaign_id = where.get('campaign_id')
+        if not isinstance(campaign_id, int):
+            campaign_id = None
+        event_bus.publish(ChangeEvent('character', None, 'bulk_update', campaign_id))
+        return count
+
     def delete_character(self, character_id: int) -> None:
         """Delete a character by ID."""
         character = self.session.get(Character, character_id)
         if not character:
             raise CharacterNotFoundError(character_id)
+        campaign_id = character.campaign_id
         self.session.delete(character)
         self.session.commit()
+        event_bus.publish(ChangeEvent('character', character_id, 'delete', campaign_id))
@@ -1,8 +1,15 @@
 """Player services."""
 
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Iterator, NamedTuple
+
+from sqlalchemy.orm.exc import StaleDataError
 from sqlmodel import Session, select
+from sqlmodel.sql.expression import Select
 
-from models import Player
+from events import ChangeEvent, event_bus
+from models import Campaign, Character, Player
 
 
 class PlayerNotFoundError(Exception):
@@ -15,6 +22,42 @@ class PlayerNotFoundError(Exception):
         self.message = f'Player with ID {player_id} not found.'
 
 
+class PlayerConflictError(Exception):
+    """Custom error for a player changed since it was loaded for editing."""
+
+    def __init__(self, player_id: int) -> None:
+        """Initialize the error."""
+        super().__init__(f'Player with ID {player_id} was changed by someone else.')
+        self.player_id = player_id
+        self.message = f'Player with ID {player_id} was changed by someone else.'
+
+
+class RosterCharacter(NamedTuple):
+    """Character entry in a player roster."""
+
+    id: int
+    character_name: str
+    is_alive: bool
+    campaign_id: int
+    campaign_name: str
+
+
+class PlayerRoster(NamedTuple):
+    """A player with their characters across campaigns."""
+
+    id: int
+    name: str
+    email: str
+    characters: list[RosterCharacter]
+
+
+def _group_rosters(rows: Iterable[tuple]) -> Iterator[PlayerRoster]:
+    """Group player/character rows sorted by player ID into rosters in a single pass."""
+    for (player_id, name, email), player_rows in groupby(rows, key=itemgetter(0, 1, 2)):
+        characters = [RosterCharacter._make(row[3:]) for row in player_rows if row[3] is not None]
+        yield PlayerRoster(player_id, name, email, characters)
+
+
 class PlayerService:
     """Service for player operations."""
 
@@ -26,12 +69,48 @@ class PlayerService:
         """List all players."""
         return self.session.exec(select(Player)).all()
 
+    def list_player_choices(self) -> list[tuple[int, str]]:
+        """List (id, name) pairs for dropdowns without loading full players."""
+        return [tuple(row) for row in self.session.exec(select(Player.id, Player.name).order_by(Player.name))]
+
+    def _roster_statement(self) -> Select:
+        """Build the player/character/campaign join used by the roster queries."""
+        return (
+            select(
+                Player.id,
+                Player.name,
+                Player.email,
+                Character.id,
+                Character.character_name,
+                Character.is_alive,
+                Campaign.id,
+                Campaign.name,
+            )
+            .outerjoin(Character, Character.player_id == Player.id)
+            .outerjoin(Campaign, Character.campaign_id == Campaign.id)
+            .order_by(Player.id, Character.id)
+        )
+
+    def get_player_roster(self, player_id: int) -> PlayerRoster:
+        """Get a player and their characters with campaign names in one query."""
+        rows = self.session.exec(self._roster_statement().where(Player.id == player_id))
+        roster = next(_group_rosters(rows), None)
+        if not roster:
+            raise PlayerNotFoundError(player_id)
+        return roster
+
+    def iter_player_rosters(self, batch_size: int = 1000) -> Iterator[PlayerRoster]:
+        """Stream every player's roster, grouped from one sorted result."""
+        rows = self.session.exec(self._roster_statement().execution_options(yield_per=batch_size))
+        yield from _group_rosters(rows)
+
     def add_player(self, player: Player) -> Player:
         """Add a new player."""
         # TODO: Add PasswordHashing here!
         self.session.add(player)
         self.session.commit()
         self.session.refresh(player)
+        event_bus.publish(ChangeEvent('player', player.id, 'create'))
         return player
 
     def get_player(self, player_id: int) -> Player:
@@ -42,14 +121,21 @@ class PlayerService:
         return player
 
     def update_player(self, player_id: int, player_data: Player) -> Player:
-        """Update a player by ID."""
+        """Update a player by ID, rejecting edits made against an older version."""
         player = self.session.get(Player, player_id)
         if not player:
             raise PlayerNotFoundError(player_id)
-        for key, value in player_data.model_dump().items():
+        if player_data.version is not None and player_data.version != player.version:
+            raise PlayerConflictError(player_id)
+        for key, value in player_data.model_dump(exclude={'id', 'version'}).items():
             setattr(player, key, value)
-        self.session.commit()
+        try:
+            self.session.commit()
+        except StaleDataError:
+            self.session.rollback()
+            raise PlayerConflictError(player_id)
         self.session.refresh(player)
+        event_bus.publish(ChangeEvent('player', player_id, 'update'))
         return player
 
     def delete_player(self, player_id: int) -> None:
@@ -59,3 +145,4 @@ class PlayerService:
             raise PlayerNotFoundError(player_id)
         self.session.delete(player)
         self.session.commit()
+        event_bus.publish(ChangeEvent('player', player_id, 'delete'))
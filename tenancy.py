@@ -0,0 +1,187 @@
+"""Per-request tenant routing and cross-shard queries."""
+
+import glob
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, NamedTuple, TypeVar
+
+from flask import Flask, Request, abort, g, request
+from sqlalchemy import Connection, Engine, NullPool, create_engine, make_url
+
+from db import (
+    TenantError,
+    TenantNotFoundError,
+    allowed_tenants,
+    current_tenant,
+    engines,
+    get_engine,
+    tenant_database_url,
+)
+from models import create_db
+
+T = TypeVar('T')
+
+# Maps a request to a tenant key, or None for the default database
+TenantResolver = Callable[[Request], str | None]
+
+# Serializes the first use of a shard, which may upgrade its schema
+_shard_lock = threading.Lock()
+
+
+class ShardResult(NamedTuple):
+    """Outcome of a fanned-out call on one tenant's shard."""
+
+    tenant: str
+    value: object = None
+    error: Exception | None = None
+
+
+def _tenant_exists(tenant: str, database_url: str) -> bool:
+    """Whether the tenant is allowed and, for SQLite, its shard file has been created."""
+    allowed = allowed_tenants()
+    if allowed is not None and tenant not in allowed:
+        return False
+    url = make_url(database_url)
+    if url.get_backend_name() == 'sqlite':
+        return bool(url.database) and os.path.isfile(url.database)
+    # A server database can't be checked without connecting, so it must be on the allowlist
+    return allowed is not None
+
+
+def get_tenant_engine(tenant: str) -> Engine:
+    """Get the engine for an existing tenant's shard; shards are only created by create_tenant."""
+    database_url = tenant_database_url(tenant)
+    engine = engines.get(database_url)
+    if engine is not None:
+        return engine
+    with _shard_lock:
+        engine = engines.get(database_url)
+        if engine is None:
+            if not _tenant_exists(tenant, database_url):
+                raise TenantNotFoundError(tenant)
+            engine = get_engine(database_url)
+            # Bring shards created before a schema change up to date; repeats cheaply if the engine is evicted
+            create_db(database_url, skip_if_current=True)
+    return engine
+
+
+def create_tenant(tenant: str) -> Engine:
+    """Create a tenant's shard and its schema; safe to run again on an existing shard."""
+    database_url = tenant_database_url(tenant)
+    allowed = allowed_tenants()
+    if allowed is not None and tenant not in allowed:
+        raise TenantError(f'Add {tenant!r} to TENANTS before creating its shard.')
+    url = make_url(database_url)
+    if url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:'):
+        # SQLite creates the file but not its directory
+        os.makedirs(os.path.dirname(os.path.abspath(url.database)), exist_ok=True)
+    with _shard_lock:
+        create_db(database_url)
+    return get_engine(database_url)
+
+
+def tenant_from_subdomain(domain: str) -> TenantResolver:
+    """Resolve the tenant from the first label of the Host, e.g. acme.example.com under example.com."""
+    domain = domain.lower().strip('.')
+
+    def resolve(request: Request) -> str | None:
+        host = request.host.rsplit(':', 1)[0].lower()
+        if host == domain:
+            return None
+        tenant, _, parent = host.partition('.')
+        if parent != domain:
+            raise TenantError(f'Host {host!r} is not a subdomain of {domain!r}.')
+        return tenant
+
+    return resolve
+
+
+def tenant_from_header(header: str) -> TenantResolver:
+    """Resolve the tenant from a header; only safe behind a proxy that sets it and drops any sent by the client."""
+
+    def resolve(request: Request) -> str | None:
+        return request.headers.get(header)
+
+    return resolve
+
+
+def default_resolver() -> TenantResolver:
+    """The resolver chosen by TENANT_FROM: subdomain of TENANT_DOMAIN (default) or the proxy's TENANT_HEADER."""
+    source = os.getenv('TENANT_FROM', 'subdomain')
+    if source == 'header':
+        return tenant_from_header(os.getenv('TENANT_HEADER', 'X-Tenant'))
+    if source != 'subdomain':
+        raise TenantError(f'TENANT_FROM must be subdomain or header, not {source!r}.')
+    if not os.getenv('TENANT_DOMAIN'):
+        raise TenantError('Set TENANT_DOMAIN to route tenants by subdomain.')
+    return tenant_from_subdomain(os.getenv('TENANT_DOMAIN'))
+
+
+def init_tenancy(app: Flask, resolve_tenant: TenantResolver | None = None) -> None:
+    """Route each request to the existing shard of the tenant the resolver names; no tenant means DATABASE_URL."""
+    resolve_tenant = resolve_tenant or default_resolver()
+
+    @app.before_request
+    def set_tenant() -> None:
+        try:
+            tenant = resolve_tenant(request)
+            if tenant is None:
+                return
+            get_tenant_engine(tenant)
+        except TenantNotFoundError as e:
+            abort(404, e.message)
+        except TenantError as e:
+            abort(400, e.message)
+        g.tenant_token = current_tenant.set(tenant)
+
+    @app.teardown_request
+    def reset_tenant(exc: BaseException | None) -> None:
+        token = g.pop('tenant_token', None)
+        if token is not None:
+            current_tenant.reset(token)
+
+
+def list_tenants() -> list[str]:
+    """Known tenants: the TENANTS list if set, otherwise the SQLite shard files matching TENANT_DATABASE_URL."""
+    allowed = allowed_tenants()
+    if allowed is not None:
+        return sorted(allowed)
+    template = os.getenv('TENANT_DATABASE_URL', '')
+    if not template.startswith('sqlite'):
+        return []
+    pattern = make_url(template.replace('{tenant}', '*')).database
+    prefix, suffix = pattern.split('*', 1)
+    return sorted(path[len(prefix):len(path) - len(suffix)] for path in glob.glob(pattern))
+
+
+def fan_out(call: Callable[[Engine], T], tenants: list[str], max_workers: int = 8) -> list[ShardResult]:
+    """Run call against every tenant's shard in parallel, in tenant order; one failing shard doesn't stop the rest."""
+
+    def run(tenant: str) -> ShardResult:
+        try:
+            return ShardResult(tenant, call(get_tenant_engine(tenant)))
+        except Exception as e:
+            return ShardResult(tenant, error=e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, tenants))
+
+
+@contextmanager
+def read_only_connection(engine: Engine) -> Iterator[Connection]:
+    """A connection that can't write: SQLite files are opened with mode=ro, other backends use a read-only transaction."""
+    if engine.dialect.name == 'sqlite':
+        path = os.path.abspath(engine.url.database)
+        read_only = create_engine(f'sqlite:///file:{path}?mode=ro&uri=true', poolclass=NullPool)
+        try:
+            with read_only.connect() as connection:
+                yield connection
+        finally:
+            read_only.dispose()
+        return
+    with engine.connect() as connection:
+        # PostgreSQL and MySQL reject writes for the rest of this transaction, which is rolled back on exit
+        connection.exec_driver_sql('SET TRANSACTION READ ONLY')
+        yield connection
@@ -0,0 +1,154 @@
+"""Tests for the application factory."""
+
+import os
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from app import LazyBlueprintMiddleware, create_app
+
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Fixture pointing DATABASE_URL at a temporary SQLite file."""
+    url = f'sqlite:///{tmp_path}/test.db'
+    monkeypatch.setenv('DATABASE_URL', url)
+    return url
+
+
+def test_create_app_registers_blueprints(database_url: str) -> None:
+    """Test that the default startup registers every blueprint."""
+    # Act
+    app = create_app(fast_startup=False)
+
+    # Assert
+    assert {'home', 'players', 'campaigns', 'characters'} <= set(app.blueprints)
+
+
+def test_fast_startup_defers_blueprints(database_url: str) -> None:
+    """Test that fast startup registers blueprints on the first request."""
+    # Arrange
+    app = create_app(fast_startup=True)
+    assert isinstance(app.wsgi_app, LazyBlueprintMiddleware)
+    assert 'home' not in app.blueprints
+
+    # Act
+    response = app.test_client().get('/')
+
+    # Assert
+    assert response.status_code == 200
+    assert 'home' in app.blueprints
+
+
+def test_import_app_defers_heavy_modules(database_url: str) -> None:
+    """Test that importing the app doesn't load the route, service or form modules."""
+    # Arrange
+    root = Path(__file__).resolve().parent.parent
+    script = 'import sys, app; print(" ".join(sorted(sys.modules)))'
+    deferred = ('routes', 'services', 'flask_wtf', 'wtforms')
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        cwd=root,
+        env={**os.environ, 'PYTHONPATH': str(root)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Assert
+    assert [name for name in result.stdout.split() if name.split('.')[0] in deferred] == []
+
+
+def test_memory_profile_serves_report(database_url: str) -> None:
+    """Test that memory profiling is off by default and exposes /admin/memory when enabled."""
+    # Arrange
+    default_app = create_app(fast_startup=False)
+    profiled_app = create_app(fast_startup=False, memory_profile=True)
+
+    # Act
+    try:
+        default_status = default_app.test_client().get('/admin/memory').status_code
+        report = profiled_app.test_client().get('/admin/memory').get_json()
+    finally:
+        tracemalloc.stop()
+
+    # Assert
+    assert default_status == 404
+    assert {'rss_bytes', 'traced_peak_bytes', 'endpoints'} <= set(report)
+
+
+def test_close_unknown_campaign_returns_404(database_url: str) -> None:
+    """Test that closing a campaign that doesn't exist is a 404, not a server error."""
+    # Arrange
+    app = create_app(fast_startup=False)
+    app.config['WTF_CSRF_ENABLED'] = False
+
+    # Act
+    response = app.test_client().post('/campaigns/999/close', data={'kill_characters': 'y'})
+
+    # Assert
+    assert response.status_code == 404
+
+
+def test_close_campaign_flashes_counts(database_url: str) -> None:
+    """Test that closing a campaign reports how many characters were marked dead."""
+    # Arrange
+    app = create_app(fast_startup=False)
+    app.config['WTF_CSRF_ENABLED'] = False
+    client = app.test_client()
+    client.post('/campaigns', data={'name': 'Tomb of Horrors', 'is_active': 'y'})
+
+    # Act
+    response = client.post('/campaigns/1/close', data={'kill_characters': 'y'}, follow_redirects=True)
+
+    # Assert
+    assert 'Campaign closed and 0 characters marked dead.' in response.text
+
+
+def test_reassign_from_unknown_campaign_returns_404(database_url: str) -> None:
+    """Test that reassigning from a campaign that doesn't exist is a 404, not a silent redirect."""
+    # Arrange
+    app = create_app(fast_startup=False)
+    app.config['WTF_CSRF_ENABLED'] = False
+    client = app.test_client()
+    client.post('/campaigns', data={'name': 'Tomb of Horrors', 'is_active': 'y'})
+
+    # Act
+    response = client.post('/campaigns/999/reassign', data={'to_campaign_id': '1'})
+
+    # Assert
+    assert response.status_code == 404
+
+
+def test_edit_unknown_player_returns_404(database_url: str) -> None:
+    """Test that submitting the edit form for a player that doesn't exist is a 404, not a server error."""
+    # Arrange
+    app = create_app(fast_startup=False)
+    app.config['WTF_CSRF_ENABLED'] = False
+    data = {'name': 'Alice', 'email': 'alice@example.com', 'version': '1'}
+
+    # Act
+    response = app.test_client().post('/players/999', data=data)
+
+    # Assert
+    assert response.status_code == 404
+
+
+def test_live_updates_off_disables_events(database_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that with live updates off, /events tells clients to stop and pages don't subscribe."""
+    # Arrange
+    monkeypatch.setenv('LIVE_UPDATES', '0')
+    client = create_app(fast_startup=False).test_client()
+
+    # Act
+    events = client.get('/events')
+    page = client.get('/campaigns')
+
+    # Assert
+    assert events.status_code == 204
+    assert 'EventSource' not in page.text
@@ -0,0 +1,128 @@
+"""Tests for the static asset pipeline and response compression."""
+
+import gzip
+import zlib
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from assets import BUNDLES, FONTS, build_assets, init_assets
+from compression import Compress
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path) -> Path:
+    """Fixture with every vendor file already downloaded."""
+    vendor_dir = tmp_path / 'vendor'
+    vendor_dir.mkdir()
+    for url in [*FONTS, *(url for urls in BUNDLES.values() for url in urls)]:
+        name = url.rsplit('/', 1)[-1]
+        content = 'src:url(../webfonts/fa-solid-900.woff2)' if name == 'all.min.css' else name
+        (vendor_dir / name).write_text(content)
+    return tmp_path
+
+
+@pytest.fixture
+def app(static_dir: Path) -> Flask:
+    """Fixture for an app with built assets and compression enabled."""
+    build_assets(static_dir)
+    app = Flask(__name__, static_folder=str(static_dir))
+    init_assets(app)
+    Compress(app)
+    app.add_url_rule('/big', 'big', lambda: 'x' * 1000)
+    app.add_url_rule('/small', 'small', lambda: 'x' * 10)
+    return app
+
+
+def test_build_assets_fingerprints_bundles(static_dir: Path) -> None:
+    """Test that bundles get hashed names and font URLs are rewritten."""
+    # Act
+    manifest = build_assets(static_dir)
+
+    # Assert
+    css = (static_dir / 'dist' / manifest['app.css']).read_text()
+    assert manifest['app.css'].startswith('app.') and manifest['app.css'] != 'app.css'
+    assert manifest['fa-solid-900.woff2'] in css
+    assert '../webfonts/' not in css
+
+
+def test_asset_served_with_far_future_cache(app: Flask) -> None:
+    """Test that fingerprinted assets are cached for a year and served pre-compressed."""
+    # Arrange
+    with app.test_request_context():
+        url = app.jinja_env.globals['asset_url']('app.js')
+
+    # Act
+    response = app.test_client().get(url, headers={'Accept-Encoding': 'gzip'})
+
+    # Assert
+    assert response.cache_control.max_age == 365 * 24 * 60 * 60
+    assert response.cache_control.immutable
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert b'jquery' in gzip.decompress(response.data)
+
+
+def test_compresses_large_responses(app: Flask) -> None:
+    """Test that responses over the size threshold are gzipped."""
+    # Act
+    response = app.test_client().get('/big', headers={'Accept-Encoding': 'gzip'})
+
+    # Assert
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.data) == b'x' * 1000
+
+
+def test_skips_small_responses(app: Flask) -> None:
+    """Test that responses under the size threshold are left alone."""
+    # Act
+    response = app.test_client().get('/small', headers={'Accept-Encoding': 'gzip'})
+
+    # Assert
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_compresses_streamed_responses(app: Flask) -> None:
+    """Test that streamed bodies are compressed chunk by chunk."""
+    # Arrange
+    app.add_url_rule('/stream', 'stream', lambda: app.response_class((f'{i},' for i in range(100)), mimetype='text/plain'))
+
+    # Act
+    response = app.test_client().get('/stream', headers={'Accept-Encoding': 'gzip'})
+
+    # Assert
+    assert 'Content-Length' not in response.headers
+    assert gzip.decompress(response.data) == ''.join(f'{i},' for i in range(100)).encode()
+
+
+def test_streamed_chunks_are_flushed(app: Flask) -> None:
+    """Test that each streamed chunk can be decoded before the stream ends."""
+    # Arrange
+    app.add_url_rule('/slow', 'slow', lambda: app.response_class(iter(['first,', 'second']), mimetype='text/plain'))
+    decompressor = zlib.decompressobj(31)
+
+    # Act
+    response = app.test_client().get('/slow', headers={'Accept-Encoding': 'gzip'}, buffered=False)
+    first = decompressor.decompress(next(iter(response.response)))
+    response.close()
+
+    # Assert
+    assert first == b'first,'
+
+
+def test_prefers_brotli_when_installed(app: Flask) -> None:
+    """Test that brotli is used when installed and accepted, for whole and streamed bodies."""
+    # Arrange
+    brotli = pytest.importorskip('brotli')
+    app.add_url_rule('/stream', 'stream', lambda: app.response_class((f'{i},' for i in range(100)), mimetype='text/plain'))
+    client = app.test_client()
+
+    # Act
+    response = client.get('/big', headers={'Accept-Encoding': 'gzip, br'})
+    streamed = client.get('/stream', headers={'Accept-Encoding': 'br'})
+
+    # Assert
+    assert response.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(response.data) == b'x' * 1000
+    assert streamed.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(streamed.data) == ''.join(f'{i},' for i in range(100)).encode()
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import MagicMock
 from models import Campaign
-from services.campaign_service import CampaignService
+from services.campaign_service import CampaignNotFoundError, CampaignService, CloseCampaignResult
 
 @pytest.fixture
 def session():
@@ -78,3 +78,48 @@ def test_list_campaigns(service: CampaignService, session):
 
     # Assert
     assert result == campaigns
+
+def test_close_campaign(service: CampaignService, session):
+    """Test closing a campaign and marking its characters dead."""
+    # Arrange
+    session.connection.return_value.execute.side_effect = [MagicMock(rowcount=1), MagicMock(rowcount=12)]
+
+    # Act
+    result = service.close_campaign(1, kill_characters=True)
+
+    # Assert
+    assert result == CloseCampaignResult(campaigns=1, characters=12)
+    session.commit.assert_called_once()
+
+def test_close_campaign_not_found(service: CampaignService, session):
+    """Test closing a campaign that doesn't exist."""
+    # Arrange
+    session.connection.return_value.execute.return_value.rowcount = 0
+
+    # Act & Assert
+    with pytest.raises(CampaignNotFoundError):
+        service.close_campaign(1)
+    session.commit.assert_not_called()
+
+def test_reassign_characters(service: CampaignService, session):
+    """Test moving every character to another campaign in one statement."""
+    # Arrange
+    session.get.return_value = Campaign(id=2, name="Target Campaign")
+    session.connection.return_value.execute.return_value.rowcount = 7
+
+    # Act
+    result = service.reassign_characters(1, 2)
+
+    # Assert
+    assert result == 7
+    session.connection.return_value.execute.assert_called_once()
+
+def test_reassign_characters_unknown_source(service: CampaignService, session):
+    """Test that reassigning from a campaign that doesn't exist moves nothing."""
+    # Arrange
+    session.get.return_value = None
+
+    # Act & Assert
+    with pytest.raises(CampaignNotFoundError):
+        service.reassign_characters(999, 2)
+    session.connection.return_value.execute.assert_not_called()
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import MagicMock
 from models import Character
-from services.character_service import CharacterService
+from services.character_service import CharacterRow, CharacterService
 
 @pytest.fixture
 def session():
@@ -64,3 +64,41 @@ def test_delete_character(service: CharacterService, session):
     # Assert
     session.delete.assert_called_once_with(character)
     session.commit.assert_called_once()
+
+def test_list_character_rows(service: CharacterService, session):
+    """Test listing characters as lightweight rows filtered in SQL."""
+    # Arrange
+    session.exec.return_value = [(1, "Test Character", True, 2, "Player", 3, "Campaign")]
+
+    # Act
+    result = service.list_character_rows(campaign_id=3, is_alive=True)
+
+    # Assert
+    assert result == [CharacterRow(1, "Test Character", True, 2, "Player", 3, "Campaign")]
+    assert result[0].campaign_name == "Campaign"
+    statement = str(session.exec.call_args.args[0])
+    assert "character.campaign_id = " in statement
+    assert "character.is_alive = " in statement
+    assert "character.player_id = :" not in statement
+
+def test_bulk_update(service: CharacterService, session):
+    """Test that a bulk update runs one UPDATE and returns the affected count."""
+    # Arrange
+    session.connection.return_value.execute.return_value.rowcount = 3
+
+    # Act
+    result = service.bulk_update(where={"id": [1, 2, 3]}, values={"is_alive": False})
+
+    # Assert
+    assert result == 3
+    statement = str(session.connection.return_value.execute.call_args.args[0])
+    assert statement.startswith("UPDATE character SET is_alive=")
+    assert "version=(character.version + " in statement
+    assert "character.id IN (" in statement
+    session.commit.assert_called_once()
+
+def test_bulk_update_rejects_unknown_columns(service: CharacterService, session):
+    """Test that bulk updates only accept character columns."""
+    # Act & Assert
+    with pytest.raises(ValueError):
+        service.bulk_update(where={"campaign_id": 1}, values={"level": 2})
@@ -0,0 +1,125 @@
+"""Tests for the change-event bus and SSE stream."""
+
+import json
+import threading
+from itertools import islice
+
+from db import current_tenant
+from events import ChangeEvent, EventBus
+from routes.sse import event_stream
+
+
+def test_publish_filters_by_campaign() -> None:
+    """Test that campaign subscriptions only receive their campaign's events."""
+    # Arrange
+    bus = EventBus()
+    everything = bus.subscribe()
+    campaign_one = bus.subscribe(campaign_id=1)
+
+    # Act
+    bus.publish(ChangeEvent('character', 10, 'update', 1))
+    bus.publish(ChangeEvent('character', 11, 'update', 2))
+
+    # Assert
+    assert [everything.get(0), everything.get(0)] == [
+        ChangeEvent('character', 10, 'update', 1),
+        ChangeEvent('character', 11, 'update', 2),
+    ]
+    assert campaign_one.get(0).id == 10
+    assert campaign_one.get(0) is None
+
+
+def test_publish_filters_by_tenant() -> None:
+    """Test that events only reach subscribers of the publisher's tenant, even for the same campaign id."""
+    # Arrange
+    bus = EventBus()
+    green = bus.subscribe(campaign_id=1, tenant='green')
+    blue = bus.subscribe(campaign_id=1, tenant='blue')
+    default = bus.subscribe()
+
+    # Act
+    token = current_tenant.set('green')
+    try:
+        bus.publish(ChangeEvent('campaign', 1, 'update', 1))
+    finally:
+        current_tenant.reset(token)
+
+    # Assert
+    assert green.get(0) == ChangeEvent('campaign', 1, 'update', 1, tenant='green')
+    assert blue.get(0) is None
+    assert default.get(0) is None
+
+
+def test_overflow_drops_oldest_events() -> None:
+    """Test that a full queue drops the oldest events and counts them."""
+    # Arrange
+    bus = EventBus()
+    subscription = bus.subscribe(maxsize=3)
+
+    # Act
+    for event_id in range(5):
+        bus.publish(ChangeEvent('campaign', event_id, 'update', event_id))
+
+    # Assert
+    assert subscription.take_dropped() == 2
+    assert [subscription.get(0).id for _ in range(3)] == [2, 3, 4]
+
+
+def test_many_concurrent_subscribers() -> None:
+    """Test that every concurrent subscriber receives every event exactly once."""
+    # Arrange
+    bus = EventBus()
+    subscriber_count, event_count = 200, 50
+    received: list[list[int]] = [[] for _ in range(subscriber_count)]
+    ready = threading.Barrier(subscriber_count + 1)
+
+    def consume(index: int) -> None:
+        with bus.subscribe(maxsize=event_count) as subscription:
+            ready.wait()
+            while len(received[index]) < event_count:
+                event = subscription.get(timeout=5)
+                if event is None:
+                    break
+                received[index].append(event.id)
+
+    threads = [threading.Thread(target=consume, args=(index,)) for index in range(subscriber_count)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+
+    # Act
+    publishers = [
+        threading.Thread(target=lambda start=start: [
+            bus.publish(ChangeEvent('character', event_id, 'update', 1)) for event_id in range(start, event_count, 5)
+        ])
+        for start in range(5)
+    ]
+    for thread in publishers:
+        thread.start()
+    for thread in publishers + threads:
+        thread.join()
+
+    # Assert
+    assert all(sorted(ids) == list(range(event_count)) for ids in received)
+    assert bus.subscriber_count == 0
+
+
+def test_event_stream_formats_sse_messages() -> None:
+    """Test that the SSE stream emits change, overflow and keep-alive messages."""
+    # Arrange
+    bus = EventBus()
+    subscription = bus.subscribe(maxsize=1)
+    bus.publish(ChangeEvent('campaign', 1, 'create', 1))
+    bus.publish(ChangeEvent('campaign', 2, 'create', 2))
+
+    # Act
+    stream = event_stream(subscription, heartbeat=0.01)
+    messages = list(islice(stream, 4))
+    stream.close()
+
+    # Assert
+    assert messages[0] == 'retry: 5000\n\n'
+    assert messages[1] == 'event: overflow\ndata: {"dropped": 1}\n\n'
+    assert json.loads(messages[2].split('data: ')[1]) == {'entity': 'campaign', 'id': 2, 'op': 'create', 'campaign_id': 2}
+    assert messages[3] == ': keep-alive\n\n'
+    assert bus.subscriber_count == 0
@@ -0,0 +1,94 @@
+"""Tests for the memory profiler."""
+
+import tracemalloc
+from typing import Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+from memprofile import MAX_SITES, EndpointMemory, MemoryProfiler, allocation_site
+
+retained: list[bytes] = []
+
+
+@pytest.fixture
+def client() -> Generator[FlaskClient, None, None]:
+    """Fixture providing an app with a leaking route and the profiler enabled."""
+    app = Flask(__name__)
+
+    @app.get('/leak')
+    def leak() -> str:
+        retained.append(bytes(100_000))
+        return 'ok'
+
+    MemoryProfiler(app)
+    yield app.test_client()
+    retained.clear()
+    tracemalloc.stop()
+
+
+def get(client: FlaskClient, path: str) -> dict | str:
+    """Request a path and close the response so the profiler records it."""
+    response = client.get(path)
+    body = response.get_json(silent=True) or response.text
+    response.close()
+    return body
+
+
+def test_profiler_records_endpoint_memory(client: FlaskClient) -> None:
+    """Test that peak, retained memory and the allocating line are reported per endpoint."""
+    # Arrange
+    get(client, '/leak')
+    get(client, '/leak')
+
+    # Act
+    report = get(client, '/admin/memory')
+
+    # Assert
+    stats = report['endpoints']['leak']
+    assert stats['requests'] == 2
+    assert stats['peak_bytes_max'] >= 100_000
+    assert stats['retained_bytes_total'] >= 200_000
+    assert stats['top_sites'][0]['site'].startswith('tests/test_memprofile.py:')
+    assert 'memory.memory_report' not in report['endpoints']
+
+
+def test_profiler_reset(client: FlaskClient) -> None:
+    """Test that DELETE /admin/memory clears the figures."""
+    # Arrange
+    get(client, '/leak')
+
+    # Act
+    client.delete('/admin/memory')
+
+    # Assert
+    assert get(client, '/admin/memory')['endpoints'] == {}
+
+
+def test_endpoint_memory_bounds_sites() -> None:
+    """Test that only the largest allocation sites are kept."""
+    # Arrange
+    stats = EndpointMemory()
+    diffs = [
+        tracemalloc.StatisticDiff(tracemalloc.Traceback(((f'/lib/site-packages/m{i}.py', 1),)), i, i, 1, 1)
+        for i in range(1, MAX_SITES + 51)
+    ]
+
+    # Act
+    stats.add(0, 0, diffs)
+
+    # Assert
+    assert len(stats.site_sizes) == len(stats.site_counts) == MAX_SITES
+    assert stats.top_sites(1)[0] == ('/lib/site-packages/m250.py:1', 250, 1)
+    assert '/lib/site-packages/m1.py:1' not in stats.site_sizes
+
+
+def test_allocation_site_prefers_project_frames() -> None:
+    """Test that allocations are attributed to the innermost frame in project code."""
+    # Arrange
+    traceback = tracemalloc.Traceback(((__file__, 10), ('/venv/site-packages/sqlalchemy/orm/loading.py', 231)))
+
+    # Act / Assert
+    assert allocation_site(traceback) == 'tests/test_memprofile.py:10'
+    assert allocation_site(tracemalloc.Traceback((('/venv/site-packages/x.py', 1),))) == '/venv/site-packages/x.py:1'
@@ -6,9 +6,11 @@ from typing import Generator
 import pytest
 from flask import Flask, g
 from flask.testing import FlaskClient
+from sqlalchemy import text
+from sqlmodel import SQLModel
 
 from app import create_app
-from models import Player, create_db, get_session
+from models import SCHEMA_VERSION, Campaign, Player, create_db, get_engine, get_schema_version, get_session
 
 
 @pytest.fixture(scope='module')
@@ -21,4 +23,44 @@ def test_app() -> Generator[FlaskClient, None, None]:
             yield client
 
 
+def test_create_db_sets_schema_version(tmp_path) -> None:
+    """Test that create_db records the current schema version."""
+    # Arrange
+    database_url = f'sqlite:///{tmp_path}/test.db'
 
+    # Act
+    create_db(database_url)
+
+    # Assert
+    assert get_schema_version(get_engine(database_url)) == SCHEMA_VERSION
+
+
+def test_create_db_skips_current_schema(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that create_db skips create_all when the schema is already current."""
+    # Arrange
+    database_url = f'sqlite:///{tmp_path}/test.db'
+    create_db(database_url)
+    calls = []
+    monkeypatch.setattr(SQLModel.metadata, 'create_all', lambda engine: calls.append(engine))
+
+    # Act
+    create_db(database_url, skip_if_current=True)
+
+    # Assert
+    assert calls == []
+
+
+def test_create_db_adds_version_columns(tmp_path) -> None:
+    """Test that tables created before optimistic locking gain a version column."""
+    # Arrange
+    database_url = f'sqlite:///{tmp_path}/test.db'
+    with get_engine(database_url).begin() as connection:
+        connection.execute(text('CREATE TABLE campaign (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL, is_active BOOLEAN)'))
+        connection.execute(text("INSERT INTO campaign (id, name, is_active) VALUES (1, 'Old', 1)"))
+
+    # Act
+    create_db(database_url)
+
+    # Assert
+    with get_session(database_url) as session:
+        assert session.get(Campaign, 1).version == 1
@@ -3,10 +3,11 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.orm.exc import StaleDataError
 from sqlmodel import Session
 
 from models import Player
-from services.player_service import PlayerNotFoundError, PlayerService
+from services.player_service import PlayerConflictError, PlayerNotFoundError, PlayerService, RosterCharacter
 
 
 @pytest.fixture
@@ -128,3 +129,76 @@ def test_delete_player_not_found(player_service: PlayerService, mock_session: Ma
     # Act & Assert
     with pytest.raises(PlayerNotFoundError):
         player_service.delete_player(player_id)
+
+
+def test_get_player_roster(player_service: PlayerService, mock_session: MagicMock) -> None:
+    """Test getting a player's roster from a single joined query."""
+    # Arrange
+    mock_session.exec.return_value = iter([
+        (1, 'John Doe', 'john@example.com', 10, 'Aragorn', True, 5, 'Fellowship'),
+        (1, 'John Doe', 'john@example.com', 11, 'Boromir', False, 6, 'Gondor'),
+    ])
+
+    # Act
+    roster = player_service.get_player_roster(1)
+
+    # Assert
+    mock_session.exec.assert_called_once()
+    assert roster.name == 'John Doe'
+    assert roster.characters == [
+        RosterCharacter(10, 'Aragorn', True, 5, 'Fellowship'),
+        RosterCharacter(11, 'Boromir', False, 6, 'Gondor'),
+    ]
+
+
+def test_get_player_roster_not_found(player_service: PlayerService, mock_session: MagicMock) -> None:
+    """Test getting a roster for a missing player."""
+    # Arrange
+    mock_session.exec.return_value = iter([])
+
+    # Act & Assert
+    with pytest.raises(PlayerNotFoundError):
+        player_service.get_player_roster(1)
+
+
+def test_iter_player_rosters(player_service: PlayerService, mock_session: MagicMock) -> None:
+    """Test grouping every player's roster in one pass."""
+    # Arrange
+    mock_session.exec.return_value = iter([
+        (1, 'John Doe', 'john@example.com', 10, 'Aragorn', True, 5, 'Fellowship'),
+        (1, 'John Doe', 'john@example.com', 11, 'Boromir', False, 6, 'Gondor'),
+        (2, 'Jane Doe', 'jane@example.com', None, None, None, None, None),
+    ])
+
+    # Act
+    rosters = list(player_service.iter_player_rosters())
+
+    # Assert
+    assert [roster.id for roster in rosters] == [1, 2]
+    assert len(rosters[0].characters) == 2
+    assert rosters[1].characters == []
+
+
+def test_update_player_stale_version(player_service: PlayerService, mock_session: MagicMock) -> None:
+    """Test that an edit made against an older version is rejected."""
+    # Arrange
+    mock_session.get.return_value = Player(id=1, name='John Doe', email='john@example.com', version=3)
+    updated_data = Player(name='John Smith', email='johnsmith@example.com', version=2)
+
+    # Act & Assert
+    with pytest.raises(PlayerConflictError):
+        player_service.update_player(1, updated_data)
+    mock_session.commit.assert_not_called()
+
+
+def test_update_player_concurrent_edit(player_service: PlayerService, mock_session: MagicMock) -> None:
+    """Test that a concurrent edit caught by the versioned UPDATE is reported as a conflict."""
+    # Arrange
+    mock_session.get.return_value = Player(id=1, name='John Doe', email='john@example.com', version=2)
+    mock_session.commit.side_effect = StaleDataError()
+    updated_data = Player(name='John Smith', email='johnsmith@example.com', version=2)
+
+    # Act & Assert
+    with pytest.raises(PlayerConflictError):
+        player_service.update_player(1, updated_data)
+    mock_session.rollback.assert_called_once()
@@ -0,0 +1,83 @@
+"""Tests for the slow-query log and query plan inspection."""
+
+import logging
+
+import pytest
+from sqlalchemy import Engine, create_engine, func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, SQLModel
+
+from models import Campaign, Character, Player
+from querylog import install_slow_query_log
+from queryplan import explain_service_queries, find_full_scans
+from services.player_service import PlayerService
+
+
+@pytest.fixture
+def engine(tmp_path) -> Engine:
+    """Fixture for a small SQLite database."""
+    engine = create_engine(f'sqlite:///{tmp_path}/test.db')
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Player(id=1, name='A', email='a@example.com', password='x'), Campaign(id=1, name='C1')])
+        session.add_all([Campaign(id=2, name='C2'), Character(character_name='X', player_id=1, campaign_id=1)])
+        session.commit()
+    return engine
+
+
+def test_slow_query_log_names_service_method(engine: Engine, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that slow statements are logged with the calling service method."""
+    # Arrange
+    install_slow_query_log(engine, threshold_ms=0)
+
+    # Act
+    with caplog.at_level(logging.WARNING, logger='querylog'), Session(engine) as session:
+        PlayerService(session).list_players()
+
+    # Assert
+    assert 'PlayerService.list_players' in caplog.text
+    assert 'FROM player' in caplog.text
+
+
+def test_slow_query_log_keeps_nothing_after_errors(engine: Engine) -> None:
+    """Test that statements that raise don't leave timing state on the pooled connection."""
+    # Arrange
+    install_slow_query_log(engine, threshold_ms=0)
+
+    # Act
+    with engine.connect() as connection:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                connection.execute(text('SELECT * FROM missing_table'))
+            connection.rollback()
+        info = dict(connection.info)
+
+    # Assert
+    assert not info.get('query_start')
+
+
+def test_find_full_scans_sqlite() -> None:
+    """Test that table scans are flagged but index scans and searches aren't."""
+    # Arrange
+    plan = ['SCAN character', 'SCAN player USING INDEX ix_player_id', 'SEARCH campaign USING INTEGER PRIMARY KEY (rowid=?)']
+
+    # Act
+    scans = find_full_scans('sqlite', plan)
+
+    # Assert
+    assert scans == ['SCAN character']
+
+
+def test_explain_service_queries_rolls_back(engine: Engine) -> None:
+    """Test that every service method is explained and its writes are discarded."""
+    # Act
+    results = explain_service_queries(engine)
+
+    # Assert
+    methods = {result.method for result in results}
+    assert {'PlayerService.list_players', 'CharacterService.bulk_update', 'CampaignService.close_campaign'} <= methods
+    assert all(result.plan for result in results if result.statement.startswith('SELECT'))
+    assert 'SCAN character' in next(r for r in results if r.method == 'CharacterService.list_characters').full_scans
+    with engine.connect() as connection:
+        assert connection.execute(select(func.count()).select_from(Campaign)).scalar() == 2
+        assert connection.execute(select(Campaign.name).where(Campaign.id == 1)).scalar() == 'C1'
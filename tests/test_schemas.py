@@ -0,0 +1,77 @@
+"""Tests for the JSON request schemas."""
+
+import json
+
+import pytest
+from flask import Flask
+from flask_wtf.csrf import generate_csrf
+
+from schemas import CharacterUpdate, JsonRequestError, PlayerCreate, load_json
+
+
+@pytest.fixture
+def app() -> Flask:
+    """Fixture providing a bare app with CSRF enabled."""
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    return app
+
+
+def test_load_json_validates_body(app: Flask) -> None:
+    """Test that a valid body with a CSRF header is parsed into the schema."""
+    # Arrange
+    body = {'character_name': ' Aragorn ', 'player_id': 1, 'campaign_id': 2, 'version': 3}
+
+    # Act
+    with app.test_request_context(method='POST', data=json.dumps(body)) as ctx:
+        ctx.request.environ['HTTP_X_CSRFTOKEN'] = generate_csrf()
+        data = load_json(CharacterUpdate)
+
+    # Assert
+    assert data == CharacterUpdate(character_name='Aragorn', player_id=1, campaign_id=2, is_alive=True, version=3)
+
+
+def test_load_json_requires_csrf_header(app: Flask) -> None:
+    """Test that a request without the CSRF header is rejected."""
+    # Arrange
+    body = {'name': 'Alice', 'email': 'alice@example.com', 'password': 'secret'}
+
+    # Act
+    with app.test_request_context(method='POST', data=json.dumps(body)):
+        with pytest.raises(JsonRequestError) as exc_info:
+            load_json(PlayerCreate)
+
+    # Assert
+    assert exc_info.value.errors[0]['loc'] == ['X-CSRFToken']
+
+
+def test_load_json_reports_schema_errors(app: Flask) -> None:
+    """Test that schema errors are collected and returned as a 400 response."""
+    # Arrange
+    app.config['WTF_CSRF_ENABLED'] = False
+    body = {'name': '', 'email': 'not-an-email', 'password': 'secret', 'admin': True}
+
+    # Act
+    with app.test_request_context(method='POST', data=json.dumps(body)):
+        with pytest.raises(JsonRequestError) as exc_info:
+            load_json(PlayerCreate)
+        response, status = exc_info.value.response()
+
+    # Assert
+    assert status == 400
+    assert {tuple(error['loc']) for error in response.get_json()['errors']} == {('name',), ('email',), ('admin',)}
+
+
+def test_load_json_requires_version_on_edits(app: Flask) -> None:
+    """Test that an edit without the version it was made against is rejected."""
+    # Arrange
+    app.config['WTF_CSRF_ENABLED'] = False
+    body = {'character_name': 'Aragorn', 'player_id': 1, 'campaign_id': 2}
+
+    # Act
+    with app.test_request_context(method='POST', data=json.dumps(body)):
+        with pytest.raises(JsonRequestError) as exc_info:
+            load_json(CharacterUpdate)
+
+    # Assert
+    assert [tuple(error['loc']) for error in exc_info.value.errors] == [('version',)]
@@ -0,0 +1,79 @@
+"""Tests for the dataset generator."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Engine, func, select
+from sqlalchemy.dialects import postgresql
+
+from models import Campaign, Character, Player, create_db, get_engine
+from seeding import _sync_sequences, seed_database
+
+
+@pytest.fixture
+def engine(tmp_path) -> Engine:
+    """Fixture for an empty SQLite database."""
+    database_url = f'sqlite:///{tmp_path}/seed.db'
+    create_db(database_url)
+    return get_engine(database_url)
+
+
+def _count(engine: Engine, model: type) -> int:
+    """Count the rows in a model's table."""
+    with engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(model.__table__)).scalar()
+
+
+def test_seed_database_inserts_requested_rows(engine: Engine) -> None:
+    """Test that seeding inserts the requested number of rows in batches."""
+    # Act
+    results = seed_database(engine, players=20, campaigns=5, characters=250, seed=1, batch_size=100)
+
+    # Assert
+    assert [(r.table, r.rows) for r in results] == [('player', 20), ('campaign', 5), ('character', 250)]
+    assert (_count(engine, Player), _count(engine, Campaign), _count(engine, Character)) == (20, 5, 250)
+
+
+def test_seed_database_is_deterministic(tmp_path, engine: Engine) -> None:
+    """Test that the same seed produces the same data."""
+    # Arrange
+    other_url = f'sqlite:///{tmp_path}/other.db'
+    create_db(other_url)
+    other = get_engine(other_url)
+    query = select(Character.character_name, Character.player_id, Character.campaign_id).order_by(Character.id)
+
+    # Act
+    seed_database(engine, players=10, campaigns=3, characters=50, seed=7)
+    seed_database(other, players=10, campaigns=3, characters=50, seed=7)
+
+    # Assert
+    with engine.connect() as first, other.connect() as second:
+        assert first.execute(query).all() == second.execute(query).all()
+
+
+def test_seed_database_appends_after_existing_ids(engine: Engine) -> None:
+    """Test that seeding twice adds new rows instead of colliding on primary keys."""
+    # Act
+    seed_database(engine, players=5, campaigns=2, characters=10)
+    seed_database(engine, players=5, campaigns=2, characters=10)
+
+    # Assert
+    assert _count(engine, Player) == 10
+    assert _count(engine, Character) == 20
+
+
+def test_sync_sequences_on_postgresql() -> None:
+    """Test that PostgreSQL sequences are moved past the seeded ids."""
+    # Arrange
+    engine = MagicMock()
+    engine.dialect.name = 'postgresql'
+    connection = engine.begin.return_value.__enter__.return_value
+
+    # Act
+    _sync_sequences(engine, (Player.__table__, Campaign.__table__))
+
+    # Assert
+    statements = [str(call.args[0].compile(dialect=postgresql.dialect())) for call in connection.execute.call_args_list]
+    assert len(statements) == 2
+    assert all('setval(pg_get_serial_sequence(' in statement for statement in statements)
+    assert 'max(player.id)' in statements[0] and 'max(campaign.id)' in statements[1]
@@ -0,0 +1,70 @@
+"""Tests for the production launcher."""
+
+import warnings
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip('gunicorn')
+
+from serve import build_options, live_updates_enabled, parse_args, post_fork  # noqa: E402
+
+
+def test_build_options_uses_gthread_for_threads() -> None:
+    """Test that more than one thread selects the gthread worker."""
+    # Arrange
+    args = parse_args(['--workers', '3', '--threads', '4', '--max-requests', '500'])
+
+    # Act
+    with pytest.warns(RuntimeWarning, match='only reach /events streams in the worker'):
+        options = build_options(args)
+
+    # Assert
+    assert options['workers'] == 3
+    assert options['worker_class'] == 'gthread'
+    assert options['preload_app'] is True
+    assert options['max_requests'] == 500
+
+
+def test_build_options_single_thread_uses_sync_worker() -> None:
+    """Test that one thread keeps the sync worker."""
+    # Act
+    with pytest.warns(RuntimeWarning, match='sync worker'):
+        options = build_options(parse_args(['--threads', '1', '--no-preload']))
+
+    # Assert
+    assert options['worker_class'] == 'sync'
+    assert options['preload_app'] is False
+
+
+def test_live_updates_uses_single_gthread_worker() -> None:
+    """Test that --live-updates serves everything from one gthread worker without warning."""
+    # Arrange
+    args = parse_args(['--workers', '5', '--threads', '32', '--live-updates'])
+
+    # Act
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        options = build_options(args)
+
+    # Assert
+    assert live_updates_enabled(args)
+    assert options['workers'] == 1
+    assert options['worker_class'] == 'gthread'
+
+
+def test_live_updates_needs_threads() -> None:
+    """Test that --live-updates refuses the sync worker."""
+    # Act / Assert
+    with pytest.raises(SystemExit):
+        parse_args(['--threads', '1', '--live-updates'])
+
+
+def test_post_fork_disposes_engines() -> None:
+    """Test that forked workers drop the inherited connection pool."""
+    # Act
+    with patch('serve.dispose_engines') as dispose_engines:
+        post_fork(None, None)
+
+    # Assert
+    dispose_engines.assert_called_once()
@@ -0,0 +1,210 @@
+"""Tests for tenant routing and the engine cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import OperationalError
+
+from db import EngineCache, TenantError, TenantNotFoundError, current_tenant, get_engine, tenant_database_url
+from tenancy import create_tenant, fan_out, get_tenant_engine, init_tenancy, list_tenants, read_only_connection
+
+
+@pytest.fixture
+def shard_template(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Fixture pointing TENANT_DATABASE_URL at a temporary shard directory."""
+    template = f'sqlite:///{tmp_path}/shards/{{tenant}}.db'
+    monkeypatch.setenv('TENANT_DATABASE_URL', template)
+    monkeypatch.delenv('TENANTS', raising=False)
+    monkeypatch.delenv('TENANT_FROM', raising=False)
+    return template
+
+
+def test_engine_cache_evicts_least_recently_used() -> None:
+    """Test that the cache disposes the least recently used engine when full."""
+    # Arrange
+    cache = EngineCache(max_size=2)
+    first, second, third = MagicMock(), MagicMock(), MagicMock()
+    cache.add('a', first)
+    cache.add('b', second)
+    cache.get('a')
+
+    # Act
+    cache.add('c', third)
+
+    # Assert
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    second.dispose.assert_called_once()
+    first.dispose.assert_not_called()
+
+
+def test_engine_cache_keeps_existing_engine() -> None:
+    """Test that adding a URL twice keeps the first engine and disposes the duplicate."""
+    # Arrange
+    cache = EngineCache(max_size=2)
+    first, duplicate = MagicMock(), MagicMock()
+    cache.add('a', first)
+
+    # Act
+    engine = cache.add('a', duplicate)
+
+    # Assert
+    assert engine is first
+    duplicate.dispose.assert_called_once()
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize('tenant', ['../etc', 'a b', '', 'x' * 65])
+def test_tenant_database_url_rejects_unsafe_keys(shard_template: str, tenant: str) -> None:
+    """Test that tenant keys outside the safe alphabet are rejected."""
+    # Act / Assert
+    with pytest.raises(TenantError):
+        tenant_database_url(tenant)
+
+
+def test_create_tenant_creates_schema(shard_template: str) -> None:
+    """Test that creating a tenant builds its shard and tables."""
+    # Act
+    engine = create_tenant('red')
+
+    # Assert
+    assert engine.url.render_as_string() == shard_template.format(tenant='red')
+    assert {'player', 'campaign', 'character'} <= set(inspect(engine).get_table_names())
+    assert get_tenant_engine('red') is engine
+
+
+def test_get_tenant_engine_rejects_unknown_tenants(shard_template: str, tmp_path) -> None:
+    """Test that a well-formed key without a shard is refused and nothing is created."""
+    # Act / Assert
+    with pytest.raises(TenantNotFoundError):
+        get_tenant_engine('nobody')
+    assert not (tmp_path / 'shards').exists()
+
+
+def test_tenants_allowlist(shard_template: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that TENANTS limits which tenants can be created and used."""
+    # Arrange
+    create_tenant('listed')
+    create_tenant('unlisted')
+    monkeypatch.setenv('TENANTS', 'listed, other')
+
+    # Act / Assert
+    assert get_tenant_engine('listed') is not None
+    with pytest.raises(TenantError):
+        create_tenant('intruder')
+    with pytest.raises(TenantNotFoundError):
+        get_tenant_engine('other')
+    assert list_tenants() == ['listed', 'other']
+
+
+def test_get_engine_follows_current_tenant(shard_template: str) -> None:
+    """Test that get_engine uses the current tenant's shard when one is set."""
+    # Arrange
+    create_tenant('blue')
+    token = current_tenant.set('blue')
+
+    # Act
+    try:
+        engine = get_engine()
+    finally:
+        current_tenant.reset(token)
+
+    # Assert
+    assert engine is get_tenant_engine('blue')
+
+
+def test_init_tenancy_routes_requests(shard_template: str, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the Host subdomain selects an existing shard and is cleared afterwards."""
+    # Arrange
+    monkeypatch.setenv('TENANT_DOMAIN', 'example.com')
+    monkeypatch.setenv('DATABASE_URL', f'sqlite:///{tmp_path}/default.db')
+    create_tenant('green')
+    app = Flask(__name__)
+    init_tenancy(app)
+    app.get('/')(lambda: get_engine().url.database or '')
+    client = app.test_client()
+
+    # Act
+    response = client.get('/', base_url='http://green.example.com')
+    unknown = client.get('/', base_url='http://zzz1.example.com')
+    other_host = client.get('/', base_url='http://green.example.org')
+    bare = client.get('/', base_url='http://example.com', headers={'X-Tenant': 'green'})
+
+    # Assert
+    assert response.text.endswith('/shards/green.db')
+    assert unknown.status_code == 404
+    assert other_host.status_code == 400
+    assert bare.text.endswith('/default.db')
+    assert sorted(path.name for path in (tmp_path / 'shards').iterdir()) == ['green.db']
+    assert current_tenant.get() is None
+
+
+def test_init_tenancy_trusts_header_only_when_configured(shard_template: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the tenant header is only read with TENANT_FROM=header, and is still validated."""
+    # Arrange
+    monkeypatch.setenv('TENANT_FROM', 'header')
+    create_tenant('green')
+    app = Flask(__name__)
+    init_tenancy(app)
+    app.get('/')(lambda: get_engine().url.database or '')
+    client = app.test_client()
+
+    # Act
+    response = client.get('/', headers={'X-Tenant': 'green'})
+    invalid = client.get('/', headers={'X-Tenant': '../green'})
+
+    # Assert
+    assert response.text.endswith('/shards/green.db')
+    assert invalid.status_code == 400
+
+
+def test_init_tenancy_needs_domain_for_subdomains(shard_template: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that subdomain routing refuses to start without TENANT_DOMAIN."""
+    # Arrange
+    monkeypatch.delenv('TENANT_DOMAIN', raising=False)
+
+    # Act / Assert
+    with pytest.raises(TenantError, match='TENANT_DOMAIN'):
+        init_tenancy(Flask(__name__))
+
+
+def test_list_tenants_finds_shard_files(shard_template: str) -> None:
+    """Test that tenants are discovered from the SQLite shard files."""
+    # Arrange
+    create_tenant('beta')
+    create_tenant('alpha')
+
+    # Act / Assert
+    assert list_tenants() == ['alpha', 'beta']
+
+
+def test_fan_out_isolates_failing_shards(shard_template: str) -> None:
+    """Test that one failing shard doesn't stop results from the others."""
+    # Arrange
+    create_tenant('one')
+    create_tenant('two')
+
+    # Act
+    results = fan_out(lambda engine: engine.url.database.rsplit('/', 1)[-1], ['one', 'bad/key', 'missing', 'two'])
+
+    # Assert
+    assert [result.tenant for result in results] == ['one', 'bad/key', 'missing', 'two']
+    assert [result.value for result in results] == ['one.db', None, None, 'two.db']
+    assert isinstance(results[1].error, TenantError)
+    assert isinstance(results[2].error, TenantNotFoundError)
+
+
+def test_read_only_connection_rejects_writes(shard_template: str) -> None:
+    """Test that queries on a read-only shard connection can read but not write."""
+    # Arrange
+    engine = create_tenant('ro')
+
+    # Act
+    with read_only_connection(engine) as connection:
+        count = connection.execute(text('SELECT count(*) FROM player')).scalar()
+        with pytest.raises(OperationalError, match='readonly'):
+            connection.execute(text("INSERT INTO player (email, password, name) VALUES ('a', 'b', 'c')"))
+
+    # Assert
+    assert count == 0